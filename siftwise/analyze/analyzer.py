@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from siftwise.schemas import FileResult
 from pathlib import Path
-from typing import List, Iterable, Optional, Set
-from .detectors import Signal, Detector, get_default_detectors
+import os
+from typing import Dict, List, Iterable, Optional, Set, Tuple, Union
+from .detectors import Signal, Detector, FileInfo, get_default_detectors
 
 # Confidence thresholds - more nuanced levels
 HIGH = 0.85      # High confidence - definitely move
@@ -12,6 +13,12 @@ MED_LOW = 0.50   # Medium-low - likely residual
 LOW = 0.40       # Low - definitely residual
 VERY_LOW = 0.30  # Very low - unknown/ambiguous
 
+# {path: (st_size, st_mtime_ns, signals)} - per-file detector output that can
+# be reused while the file is unchanged. Bump SIGNAL_CACHE_VERSION whenever
+# the default detectors change what they emit.
+SignalCache = Dict[str, Tuple[int, int, List[Signal]]]
+SIGNAL_CACHE_VERSION = 1
+
 
 def determine_residual(label: str, confidence: float, method: str, path: Path) -> tuple[bool, str]:
     """
@@ -118,20 +125,62 @@ def pick_label(signals: List[Signal]) -> Signal:
     return best
 
 
+def scan_files(root: Path) -> List[FileInfo]:
+    """
+    Recursively collect every regular file under root as a FileInfo.
+
+    Walks with os.scandir, so directory/file checks come from the entries'
+    cached type info and each file is stat()ed once; pass the result
+    straight to analyze_paths() to skip its own stat. Like
+    Path.rglob("*"), symlinked directories are not descended into.
+    """
+    infos: List[FileInfo] = []
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    info = FileInfo.from_entry(entry)
+                    if info.is_file:
+                        infos.append(info)
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+    return infos
+
+
 def analyze_paths(
-    paths: Iterable[Path],
+    paths: Iterable[Union[Path, FileInfo]],
     root_out: Path,
     detectors: Optional[List[Detector]] = None,
     refinement_iteration: int = 1,
+    signal_cache: Optional[SignalCache] = None,
 ) -> List[FileResult]:
     """
     Enhanced analyzer with smarter residual detection and iteration awareness.
     
     Args:
-        paths: Files to analyze
+        paths: Files to analyze (Paths, or FileInfos from scan_files to
+            reuse their stat)
         root_out: Output root directory
         detectors: Custom detectors (uses defaults if None)
         refinement_iteration: Which iteration this is (1=initial, 2+=refinement)
+        signal_cache: Optional detector-output cache (default detectors only).
+            Files whose size and mtime match their entry skip the detectors;
+            the others are scored and written back into the dict.
     """
     if detectors is None:
         detectors = get_default_detectors()
@@ -141,18 +190,37 @@ def analyze_paths(
     label_counts: dict[str, int] = {}
     
     # First pass: collect all signals
+    # One stat per file, shared by every detector
+    infos = [
+        info
+        for info in (p if isinstance(p, FileInfo) else FileInfo.from_path(p) for p in paths)
+        if info.is_file
+    ]
+    
+    # Reuse cached signals for unchanged files; only the rest hit detectors
+    known: dict[Path, List[Signal]] = {}
+    if signal_cache is not None:
+        for info in infos:
+            entry = signal_cache.get(str(info.path))
+            if entry is not None and entry[:2] == (info.st.st_size, info.st.st_mtime_ns):
+                known[info.path] = entry[2]
+    to_score = [info for info in infos if info.path not in known]
+    
+    # Run each detector over the whole batch (lets detectors vectorize),
+    # keeping per-file signals in detector order
+    detector_signals = [d.score_batch(to_score) for d in detectors]
+    for i, info in enumerate(to_score):
+        known[info.path] = [ds[i] for ds in detector_signals if ds[i]]
+        if signal_cache is not None:
+            signal_cache[str(info.path)] = (
+                info.st.st_size, info.st.st_mtime_ns, known[info.path]
+            )
+    
     path_signals: dict[Path, List[Signal]] = {}
-    for p in paths:
-        if not p.is_file():
-            continue
-        
-        sigs: List[Signal] = []
-        for d in detectors:
-            s = d.score(p)
-            if s:
-                sigs.append(s)
+    for info in infos:
+        sigs = known[info.path]
         
-        path_signals[p] = sigs
+        path_signals[info.path] = sigs
         
         # Collect statistics
         if sigs:
@@ -10,9 +10,17 @@ Provides stronger detection through:
 All detectors are explicit rule-based - no ML/embeddings.
 """
 
+import os
+import re
+import stat
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Sequence, Tuple
+
+try:
+    import ahocorasick  # optional accelerator (pip install pyahocorasick)
+except ImportError:
+    ahocorasick = None
 
 
 @dataclass
@@ -24,12 +32,64 @@ class Signal:
     why: str
 
 
+@dataclass(slots=True)
+class FileInfo:
+    """
+    Per-file facts shared by every detector.
+
+    Built once per path by the caller so the detector chain costs a single
+    stat() instead of one is_file()/stat() per detector.
+    """
+    path: Path
+    st: Optional[os.stat_result]
+    is_file: bool
+    stem_lower: str
+    suffix_lower: str
+    parent_names_lower: Tuple[str, ...]
+
+    @classmethod
+    def from_path(cls, path: Path) -> "FileInfo":
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            st = None
+        return cls(
+            path=path,
+            st=st,
+            is_file=st is not None and stat.S_ISREG(st.st_mode),
+            stem_lower=path.stem.lower(),
+            suffix_lower=path.suffix.lower(),
+            parent_names_lower=tuple(part.lower() for part in path.parts[:-1]),
+        )
+
+    @classmethod
+    def from_entry(cls, entry: os.DirEntry) -> "FileInfo":
+        """Build from a scandir entry, reusing the stat the scan already cached."""
+        path = Path(entry.path)
+        try:
+            st = entry.stat()
+        except OSError:
+            st = None
+        return cls(
+            path=path,
+            st=st,
+            is_file=st is not None and stat.S_ISREG(st.st_mode),
+            stem_lower=path.stem.lower(),
+            suffix_lower=path.suffix.lower(),
+            parent_names_lower=tuple(part.lower() for part in path.parts[:-1]),
+        )
+
+
 class Detector:
     """Base class for file detectors"""
-    def score(self, path: Path) -> Optional[Signal]:
+    def score(self, info: FileInfo) -> Optional[Signal]:
         """Return a Signal if this detector matches the file, else None"""
         raise NotImplementedError
 
+    def score_batch(self, infos: Sequence[FileInfo]) -> List[Optional[Signal]]:
+        """Score many files at once; defaults to calling score() per file"""
+        return [self.score(info) for info in infos]
+
 
 # Extension normalization - convert aliases to canonical forms
 EXTENSION_ALIASES = {
@@ -161,46 +221,126 @@ EXTENSION_LABELS = {
 }
 
 
+# Compound (double) extensions, checked before the final suffix
+COMPOUND_EXTENSION_LABELS = {
+    '.tar.gz': ('archives', 0.95),
+    '.tar.bz2': ('archives', 0.95),
+    '.tar.xz': ('archives', 0.90),
+    '.tar.zst': ('archives', 0.90),
+    '.sql.gz': ('data', 0.85),
+    '.csv.gz': ('data', 0.85),
+    '.json.gz': ('data', 0.85),
+    '.log.gz': ('documents', 0.75),
+}
+
+# Final suffixes that can close a compound extension; anything else skips
+# the compound probe entirely
+_COMPOUND_OUTER = frozenset('.' + ext.rsplit('.', 1)[1] for ext in COMPOUND_EXTENSION_LABELS)
+
+
+def _build_extension_table() -> dict:
+    """
+    Fuse EXTENSION_ALIASES, EXTENSION_LABELS and COMPOUND_EXTENSION_LABELS
+    into one lookup.
+
+    Maps every canonical extension, compound extension and alias to
+    (label, confidence, why) with the explanation prebuilt, so scoring a
+    file is a single dict lookup.
+    """
+    table = {
+        ext: (label, confidence, f"Extension '{ext}' matches {label}")
+        for ext, (label, confidence) in (*EXTENSION_LABELS.items(), *COMPOUND_EXTENSION_LABELS.items())
+    }
+    for alias, canonical in EXTENSION_ALIASES.items():
+        label, confidence = EXTENSION_LABELS[canonical]
+        table[alias] = (
+            label,
+            confidence,
+            f"Extension '{alias}' (normalized to '{canonical}') matches {label}",
+        )
+    return table
+
+
+_EXT_TABLE = _build_extension_table()
+
+# Parallel views of _EXT_TABLE for batch classification: a Categorical code
+# indexes straight into _EXT_ROWS.
+_EXT_KEYS = tuple(_EXT_TABLE)
+_EXT_ROWS = tuple(_EXT_TABLE.values())
+
+
+def _extension_key(info: FileInfo) -> str:
+    """
+    Return the _EXT_TABLE key to look up for a file.
+
+    Tries the last two suffixes (e.g. '.tar.gz') when the final suffix can
+    close a compound extension, then falls back to the final suffix.
+    """
+    ext = info.suffix_lower
+    if ext in _COMPOUND_OUTER:
+        head, dot, inner = info.stem_lower.rpartition('.')
+        if dot and head:
+            compound = f'.{inner}{ext}'
+            if compound in _EXT_TABLE:
+                return compound
+    return ext
+
+
 class ExtensionDetector(Detector):
     """
     Primary detector - classifies files by extension.
 
     Handles:
     - Extension normalization (e.g., .jpeg → .jpg)
-    - Double extensions (e.g., .tar.gz)
+    - Double extensions (e.g., .tar.gz, .sql.gz)
     - High confidence for known extensions
     """
 
-    def score(self, path: Path) -> Optional[Signal]:
-        if not path.is_file():
+    def score(self, info: FileInfo) -> Optional[Signal]:
+        if not info.is_file:
             return None
 
-        # Get extension and normalize
-        ext = path.suffix.lower()
-        original_ext = ext
-        ext = EXTENSION_ALIASES.get(ext, ext)
+        hit = _EXT_TABLE.get(_extension_key(info))
+        if hit is None:
+            return None
 
-        # Handle double extensions like .tar.gz
-        if ext == '.gz' and path.stem.endswith('.tar'):
-            ext = '.tar.gz'
+        label, confidence, why = hit
+        return Signal(
+            label=label,
+            confidence=confidence,
+            method="extension",
+            why=why
+        )
 
-        # Look up in mappings
-        if ext in EXTENSION_LABELS:
-            label, confidence = EXTENSION_LABELS[ext]
+    # Below this many files, per-file dict lookups beat building a Categorical
+    BATCH_MIN = 512
 
-            # Build explanation
-            why = f"Extension '{original_ext}' matches {label}"
-            if original_ext != ext:
-                why = f"Extension '{original_ext}' (normalized to '{ext}') matches {label}"
+    def score_batch(self, infos: Sequence[FileInfo]) -> List[Optional[Signal]]:
+        """
+        Classify a whole scan by extension in one vectorized lookup.
 
-            return Signal(
+        Extensions are coded against _EXT_KEYS with pandas.Categorical, so
+        the table lookup runs in C; only hits build a Signal in Python.
+        """
+        if len(infos) < self.BATCH_MIN:
+            return super().score_batch(infos)
+
+        import pandas as pd
+
+        exts = [_extension_key(info) if info.is_file else '' for info in infos]
+
+        codes = pd.Categorical(exts, categories=_EXT_KEYS).codes
+
+        signals: List[Optional[Signal]] = [None] * len(infos)
+        for i in (codes >= 0).nonzero()[0]:
+            label, confidence, why = _EXT_ROWS[codes[i]]
+            signals[i] = Signal(
                 label=label,
                 confidence=confidence,
                 method="extension",
                 why=why
             )
-
-        return None
+        return signals
 
 
 # Keyword patterns for filename analysis: keyword -> (label, confidence, description)
@@ -244,6 +384,52 @@ KEYWORD_PATTERNS = {
 }
 
 
+def _build_keyword_automaton():
+    """
+    Compile KEYWORD_PATTERNS into a single Aho-Corasick automaton.
+
+    Payloads carry the keyword's position in KEYWORD_PATTERNS as its priority,
+    so a single scan can reproduce the dict-order "first keyword wins" rule.
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for priority, (keyword, (label, confidence, description)) in enumerate(KEYWORD_PATTERNS.items()):
+        automaton.add_word(keyword, (priority, keyword, label, confidence, description))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _find_keyword(filename_lower: str) -> Optional[Tuple[int, str, str, float, str]]:
+    """
+    Find the highest-priority keyword in a lowercased filename.
+
+    Returns (position, keyword, label, confidence, description) or None.
+    """
+    if _KEYWORD_AUTOMATON is None:
+        for keyword, (label, confidence, description) in KEYWORD_PATTERNS.items():
+            position = filename_lower.find(keyword)
+            if position >= 0:
+                return position, keyword, label, confidence, description
+        return None
+
+    # One pass over the name; hits arrive in end order, so the first hit seen
+    # for a keyword is also its earliest occurrence.
+    best = None
+    for end_idx, (priority, keyword, label, confidence, description) in _KEYWORD_AUTOMATON.iter(filename_lower):
+        if best is None or priority < best[0]:
+            best = (priority, end_idx - len(keyword) + 1, keyword, label, confidence, description)
+            if priority == 0:
+                break
+
+    return best[1:] if best else None
+
+
 class KeywordDetector(Detector):
     """
     Secondary detector - looks for meaningful keywords in filenames.
@@ -252,30 +438,31 @@ class KeywordDetector(Detector):
     Confidence is lower than extension-based detection.
     """
 
-    def score(self, path: Path) -> Optional[Signal]:
-        if not path.is_file():
+    def score(self, info: FileInfo) -> Optional[Signal]:
+        if not info.is_file:
             return None
 
-        filename_lower = path.stem.lower()
+        filename_lower = info.stem_lower
 
         # Check for keyword matches
-        for keyword, (label, base_confidence, description) in KEYWORD_PATTERNS.items():
-            if keyword in filename_lower:
-                # Boost confidence slightly if keyword is at the start
-                position = filename_lower.find(keyword)
-                position_ratio = position / max(len(filename_lower), 1)
+        match = _find_keyword(filename_lower)
+        if match is None:
+            return None
 
-                confidence_boost = 0.05 if position_ratio < 0.3 else 0.0
-                final_confidence = min(base_confidence + confidence_boost, 0.95)
+        position, keyword, label, base_confidence, description = match
 
-                return Signal(
-                    label=label,
-                    confidence=final_confidence,
-                    method="keyword",
-                    why=f"Filename contains '{keyword}' ({description})"
-                )
+        # Boost confidence slightly if keyword is at the start
+        position_ratio = position / max(len(filename_lower), 1)
 
-        return None
+        confidence_boost = 0.05 if position_ratio < 0.3 else 0.0
+        final_confidence = min(base_confidence + confidence_boost, 0.95)
+
+        return Signal(
+            label=label,
+            confidence=final_confidence,
+            method="keyword",
+            why=f"Filename contains '{keyword}' ({description})"
+        )
 
 
 class DirectoryContextDetector(Detector):
@@ -324,21 +511,23 @@ class DirectoryContextDetector(Detector):
         'downloads': ('misc', 0.35),  # Downloads are usually mixed
     }
 
-    def score(self, path: Path) -> Optional[Signal]:
-        if not path.is_file():
+    def score(self, info: FileInfo) -> Optional[Signal]:
+        if not info.is_file:
             return None
 
-        # Check parent directory names (closest parent gets priority)
-        for parent in path.parents:
-            parent_name = parent.name.lower()
-
-            if parent_name in self.DIRECTORY_HINTS:
-                label, confidence = self.DIRECTORY_HINTS[parent_name]
+        # Check parent directory names (closest parent gets priority).
+        # Walk the precomputed lowercase names from the tail; no Path
+        # objects or lowercase copies are built here.
+        names = info.parent_names_lower
+        for i in range(len(names) - 1, -1, -1):
+            hit = self.DIRECTORY_HINTS.get(names[i])
+            if hit:
+                label, confidence = hit
                 return Signal(
                     label=label,
                     confidence=confidence,
                     method="directory_context",
-                    why=f"Located in '{parent.name}/' folder"
+                    why=f"Located in '{info.path.parts[i]}/' folder"
                 )
 
         return None
@@ -353,14 +542,11 @@ class SizeDetector(Detector):
     - Very large files (>1GB) - may need special handling
     """
 
-    def score(self, path: Path) -> Optional[Signal]:
-        if not path.is_file():
+    def score(self, info: FileInfo) -> Optional[Signal]:
+        if not info.is_file:
             return None
 
-        try:
-            size = path.stat().st_size
-        except (OSError, PermissionError):
-            return None
+        size = info.st.st_size
 
         # Empty files - high confidence
         if size == 0:
@@ -384,6 +570,11 @@ class SizeDetector(Detector):
         return None
 
 
+# Common date patterns in filenames, folded into one alternation:
+#   YYYY-MM-DD | YYYYMMDD | MM-DD-YYYY
+_DATE_ANY_RE = re.compile(r'\d{4}[-_]\d{2}[-_]\d{2}|\d{8}|\d{2}[-_]\d{2}[-_]\d{4}')
+
+
 class DatePatternDetector(Detector):
     """
     Detects files with date-based naming patterns.
@@ -392,28 +583,17 @@ class DatePatternDetector(Detector):
     Lower confidence - often combined with other signals.
     """
 
-    def score(self, path: Path) -> Optional[Signal]:
-        if not path.is_file():
+    def score(self, info: FileInfo) -> Optional[Signal]:
+        if not info.is_file:
             return None
 
-        filename = path.stem.lower()
-
-        # Common date patterns in filenames
-        date_patterns = [
-            r'\d{4}[-_]\d{2}[-_]\d{2}',  # YYYY-MM-DD
-            r'\d{8}',  # YYYYMMDD
-            r'\d{2}[-_]\d{2}[-_]\d{4}',  # MM-DD-YYYY
-        ]
-
-        import re
-        for pattern in date_patterns:
-            if re.search(pattern, filename):
-                return Signal(
-                    label="dated_files",
-                    confidence=0.55,
-                    method="date_pattern",
-                    why="Filename contains date pattern"
-                )
+        if _DATE_ANY_RE.search(info.stem_lower):
+            return Signal(
+                label="dated_files",
+                confidence=0.55,
+                method="date_pattern",
+                why="Filename contains date pattern"
+            )
 
         return None
 
@@ -17,10 +17,19 @@ Design principles:
 4. Safe fallbacks (never crash on bad input)
 """
 
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 import re
 from dataclasses import dataclass
+from datetime import datetime
+
+try:
+    import ahocorasick  # optional accelerator (pip install pyahocorasick)
+except ImportError:
+    ahocorasick = None
 
 
 # ============================================================================
@@ -28,7 +37,7 @@ from dataclasses import dataclass
 # ============================================================================
 
 # Organizations & Brands (financial, tech, services)
-ORG_ENTITIES = {
+ORG_ENTITIES = frozenset({
     # Financial
     "amazon", "apple", "irs", "chase", "amex", "american express",
     "bank of america", "bofa", "citi", "citibank", "wells fargo",
@@ -49,16 +58,16 @@ ORG_ENTITIES = {
     # Utilities & Services  
     "comcast", "xfinity", "verizon", "att", "tmobile", "sprint",
     "geico", "state farm", "allstate", "progressive",
-}
+})
 
 # People & Clients (starter set - user should extend)
-PERSON_ENTITIES = {
+PERSON_ENTITIES = frozenset({
     "farah", "leo", "client a", "client b", "clienta", "clientb",
     "project x", "projectx", "team alpha", "partner",
-}
+})
 
 # Places & Trips
-PLACE_ENTITIES = {
+PLACE_ENTITIES = frozenset({
     "nyc", "new york", "new york city", "manhattan", "brooklyn", "queens",
     "orlando", "miami", "tampa", "jacksonville",
     "chicago", "boston", "philadelphia", "philly",
@@ -71,7 +80,7 @@ PLACE_ENTITIES = {
     "italy", "france", "spain", "uk", "england", "germany",
     "japan", "china", "mexico", "canada",
     "trip", "vacation", "travel",
-}
+})
 
 # Acronyms that ARE valid entities (whitelist for < 3 char)
 ACRONYM_WHITELIST = {
@@ -124,6 +133,118 @@ JUNK_SUFFIXES = {
 }
 
 
+# ============================================================================
+# COMPILED PATTERNS (built once at import; these run per file)
+# ============================================================================
+
+_SEP_RE = re.compile(r'[_\-\.\s]+')
+_SEP_TABLE = str.maketrans({'_': ' ', '-': ' ', '.': ' ', '/': ' '})
+_ALNUM_RE = re.compile(r'[a-z0-9]')
+
+# Trailing year / quarter-year suffixes (strip_year_suffix)
+_YEAR_SUFFIX_RE = re.compile(r'[_\-\s]*(19|20)\d{2}$')
+_QUARTER_SUFFIX_RE = re.compile(r'[_\-\s]*Q[1-4][_\-\s]*(19|20)\d{2}$', re.IGNORECASE)
+
+# Year formats (extract_year), one alternation scanned in a single pass:
+#   q: quarter (Q1-2023, Q4_2024)
+#   m: month (2024-01, 2024_03)
+#   y: standalone 4-digit year
+_YEAR_COMBINED_RE = re.compile(
+    r'Q[1-4][_\-\s]*(?P<q>19\d{2}|20\d{2})'
+    r'|(?P<m>19\d{2}|20\d{2})[_\-](?:0[1-9]|1[0-2])'
+    r'|\b(?P<y>19\d{2}|20\d{2})\b',
+    re.IGNORECASE,
+)
+
+# Upper bound for plausible years; fixed for the life of the process
+_MAX_YEAR = datetime.now().year + 1
+
+
+# ============================================================================
+# ENTITY AUTOMATON (all dictionaries, one scan per path component)
+# ============================================================================
+
+# (single-word entities, multi-word phrases keyed by their first word)
+EntitySplit = Tuple[FrozenSet[str], Dict[str, Tuple[str, ...]]]
+
+
+@lru_cache(maxsize=32)
+def _split_entities(entities: FrozenSet[str]) -> EntitySplit:
+    """
+    Partition an entity set into single words and a first-word phrase index.
+
+    Cached per set, so match_entity_in_token splits each set only once.
+    """
+    phrases: Dict[str, List[str]] = defaultdict(list)
+    # Longest first, so "new york city" wins over "new york"
+    for entity in sorted((e for e in entities if ' ' in e), key=lambda e: (-len(e), e)):
+        phrases[entity.split(' ', 1)[0]].append(entity)
+    return (
+        frozenset(e for e in entities if ' ' not in e),
+        {word: tuple(group) for word, group in phrases.items()},
+    )
+
+
+# Dictionary order doubles as tie-break order for hits at the same position
+_ENTITY_KINDS: Tuple[Tuple[str, FrozenSet[str]], ...] = (
+    ("org", ORG_ENTITIES),
+    ("person", PERSON_ENTITIES),
+    ("place", PLACE_ENTITIES),
+)
+
+
+def _build_word_indexes():
+    """
+    Index every dictionary by word for the pure-Python scanner.
+
+    Returns (single, phrases): single maps a one-word entity to its
+    (priority, kind) pairs; phrases maps a first word to the
+    (phrase, priority, kind) triples that start with it.
+    """
+    single: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+    phrases: Dict[str, List[Tuple[str, int, str]]] = defaultdict(list)
+    for priority, (kind, entities) in enumerate(_ENTITY_KINDS):
+        for entity in sorted(entities):
+            if ' ' in entity:
+                phrases[entity.split(' ', 1)[0]].append((entity, priority, kind))
+            else:
+                single[entity].append((priority, kind))
+    return (
+        {word: tuple(hits) for word, hits in single.items()},
+        {word: tuple(hits) for word, hits in phrases.items()},
+    )
+
+
+_SINGLE_INDEX, _PHRASE_INDEX = _build_word_indexes()
+
+
+def _build_entity_automaton():
+    """
+    Compile ORG/PERSON/PLACE_ENTITIES into a single Aho-Corasick automaton.
+
+    Payloads are (entity, ((priority, kind), ...)) where priority is the
+    dictionary's position in _ENTITY_KINDS; an entity listed in several
+    dictionaries keeps every kind. Returns None when pyahocorasick is not
+    installed.
+    """
+    if ahocorasick is None:
+        return None
+
+    kinds: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+    for priority, (kind, entities) in enumerate(_ENTITY_KINDS):
+        for entity in entities:
+            kinds[entity].append((priority, kind))
+
+    automaton = ahocorasick.Automaton()
+    for entity, entity_kinds in kinds.items():
+        automaton.add_word(entity, (entity, tuple(entity_kinds)))
+    automaton.make_automaton()
+    return automaton
+
+
+_ENTITY_AUTOMATON = _build_entity_automaton()
+
+
 # ============================================================================
 # ENTITY RESULT DATACLASS
 # ============================================================================
@@ -143,6 +264,7 @@ class EntityResult:
 # NORMALIZATION FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=4096)
 def normalize_token(text: str) -> str:
     """
     Normalize a token for matching.
@@ -161,19 +283,12 @@ def normalize_token(text: str) -> str:
     if not text:
         return ""
     
-    # Lowercase and strip
-    text = text.lower().strip()
-    
-    # Replace separators with spaces
-    for sep in ['_', '-', '.', '/']:
-        text = text.replace(sep, ' ')
-    
-    # Collapse multiple spaces
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    # One translate pass maps separators to spaces; split/join collapses
+    # runs of whitespace and trims the ends.
+    return ' '.join(text.lower().translate(_SEP_TABLE).split())
 
 
+@lru_cache(maxsize=4096)
 def canonicalize_entity(text: str) -> str:
     """
     Canonicalize entity for output.
@@ -214,6 +329,12 @@ def canonicalize_entity(text: str) -> str:
     return canonical
 
 
+# Pre-warm the cache so every dictionary entity's canonical form is ready
+for _entity in (*ORG_ENTITIES, *PERSON_ENTITIES, *PLACE_ENTITIES):
+    canonicalize_entity(_entity)
+del _entity
+
+
 def strip_year_suffix(text: str) -> str:
     """
     Remove trailing year patterns from text.
@@ -223,8 +344,8 @@ def strip_year_suffix(text: str) -> str:
         "Client-A-2023" → "Client-A"
     """
     # Remove patterns like _2024, -2024, 2024
-    text = re.sub(r'[_\-\s]*(19|20)\d{2}$', '', text)
-    text = re.sub(r'[_\-\s]*Q[1-4][_\-\s]*(19|20)\d{2}$', '', text, flags=re.IGNORECASE)
+    text = _YEAR_SUFFIX_RE.sub('', text)
+    text = _QUARTER_SUFFIX_RE.sub('', text)
     
     return text.strip('_- ')
 
@@ -244,26 +365,14 @@ def extract_year(path: Path) -> Optional[int]:
     
     Returns the most recent valid year found.
     """
-    from datetime import datetime
-    current_year = datetime.now().year
-    
-    # Build full path string
-    path_str = str(path)
-    
-    # Pattern 1: Standalone 4-digit years
-    years = re.findall(r'\b(19\d{2}|20\d{2})\b', path_str)
-    valid_years = [int(y) for y in years if 1990 <= int(y) <= current_year + 1]
-    
-    # Pattern 2: Quarter formats (Q1-2023, Q4_2024)
-    quarter_matches = re.findall(r'Q[1-4][_\-\s]*(19\d{2}|20\d{2})', path_str, re.IGNORECASE)
-    valid_years.extend([int(y) for y in quarter_matches if 1990 <= int(y) <= current_year + 1])
-    
-    # Pattern 3: Month formats (2024-01, 2024_03)
-    month_matches = re.findall(r'(19\d{2}|20\d{2})[_\-](0[1-9]|1[0-2])', path_str)
-    valid_years.extend([int(y[0]) for y in month_matches if 1990 <= int(y[0]) <= current_year + 1])
+    best = 0
+    for m in _YEAR_COMBINED_RE.finditer(str(path)):
+        year = int(m.group('q') or m.group('m') or m.group('y'))
+        if 1990 <= year <= _MAX_YEAR and year > best:
+            best = year
     
     # Return most recent year
-    return max(valid_years) if valid_years else None
+    return best or None
 
 
 def match_entity_in_token(token: str, entity_set: Set[str]) -> Optional[str]:
@@ -277,26 +386,76 @@ def match_entity_in_token(token: str, entity_set: Set[str]) -> Optional[str]:
     
     Returns the matched entity (normalized) or None.
     """
+    single, phrases = _split_entities(frozenset(entity_set))
     normalized = normalize_token(token)
     
-    # Exact match
-    if normalized in entity_set:
+    # Exact match (single-word entities; multi-word ones are caught below)
+    if normalized in single:
         return normalized
     
-    # Check if token contains a multi-word entity
-    for entity in entity_set:
-        if ' ' in entity and entity in normalized:
-            return entity
+    words = normalized.split()
+    
+    # Check if token contains a multi-word entity, trying only the phrases
+    # that start with each word
+    pos = 0
+    for word in words:
+        for entity in phrases.get(word, ()):
+            if normalized.startswith(entity, pos):
+                return entity
+        pos += len(word) + 1
     
     # Check if any single-word entity is in token
-    words = normalized.split()
     for word in words:
-        if len(word) >= 3 and word in entity_set:
+        if len(word) >= 3 and word in single:
             return word
     
     return None
 
 
+def find_entities(text: str) -> List[Tuple[str, str]]:
+    """
+    Find every dictionary entity in a normalized string.
+
+    Only whole-word hits count: a match must start and end on a space or
+    the string edge, so "la" never matches inside "atlanta". Multi-word
+    entities ("new york city") are matched across words.
+
+    Returns (entity, kind) pairs ordered by position; at the same position
+    longer entities come first, then org → person → place.
+    """
+    if not text:
+        return []
+
+    hits: List[Tuple[int, int, int, str, str]] = []  # (start, -len, priority, entity, kind)
+    n = len(text)
+
+    if _ENTITY_AUTOMATON is not None:
+        for end_idx, (entity, entity_kinds) in _ENTITY_AUTOMATON.iter(text):
+            start = end_idx - len(entity) + 1
+            if start > 0 and text[start - 1] != ' ':
+                continue
+            if end_idx + 1 < n and text[end_idx + 1] != ' ':
+                continue
+            for priority, kind in entity_kinds:
+                hits.append((start, -len(entity), priority, entity, kind))
+    else:
+        # Pure-Python fallback: look each word up in the word indexes, and
+        # try only the multi-word entities that start with that word.
+        start = 0
+        for word in text.split(' '):
+            for priority, kind in _SINGLE_INDEX.get(word, ()):
+                hits.append((start, -len(word), priority, word, kind))
+            for entity, priority, kind in _PHRASE_INDEX.get(word, ()):
+                if text.startswith(entity, start):
+                    end = start + len(entity)
+                    if end == n or text[end] == ' ':
+                        hits.append((start, -len(entity), priority, entity, kind))
+            start += len(word) + 1
+
+    hits.sort()
+    return [(entity, kind) for _, _, _, entity, kind in hits]
+
+
 def is_junk_token(token: str) -> bool:
     """
     Check if token is junk and should be filtered.
@@ -310,8 +469,11 @@ def is_junk_token(token: str) -> bool:
     if not token:
         return True
     
-    normalized = normalize_token(token)
-    
+    return _is_junk_normalized(normalize_token(token))
+
+
+def _is_junk_normalized(normalized: str) -> bool:
+    """is_junk_token for a string that has already been through normalize_token."""
     # Too short unless whitelisted
     if len(normalized) < 3 and normalized not in ACRONYM_WHITELIST:
         return True
@@ -325,16 +487,35 @@ def is_junk_token(token: str) -> bool:
         return True
     
     # Only special chars
-    if not re.search(r'[a-z0-9]', normalized):
+    if not _ALNUM_RE.search(normalized):
         return True
     
     return False
 
 
+# Dictionary entries that the noise filter would reject. Entity hits are
+# always dictionary entries, so filtering them is a set lookup per hit
+# instead of re-running the junk rules per file.
+_JUNK_ENTITIES = frozenset(
+    entity
+    for _, entities in _ENTITY_KINDS
+    for entity in entities
+    if _is_junk_normalized(entity)
+)
+
+
 # ============================================================================
 # MAIN EXTRACTION FUNCTION
 # ============================================================================
 
+# Candidate scores by entity kind and where it was found
+_PARENT_SCORES = {"org": 2.0, "person": 2.0, "place": 1.8}
+_FILENAME_SCORES = {"org": 1.5, "person": 1.5, "place": 1.3}
+
+# Fixed precedence: parent beats filename, then org > person > place
+_KIND_PRECEDENCE = ("org", "person", "place")
+
+
 def extract_entities_for_result(result) -> EntityResult:
     """
     Extract entities from an analyzer Result object.
@@ -358,101 +539,60 @@ def extract_entities_for_result(result) -> EntityResult:
     # Extract year first (independent pipeline)
     year = extract_year(path)
     
-    # Tokenize filename and parent
-    filename_tokens = tokenize_path_component(path.stem)
-    parent_tokens = tokenize_path_component(path.parent.name) if path.parent.name != '.' else []
-    
-    # Remove year patterns from tokens for cleaner entity matching
+    # Remove year patterns for cleaner entity matching
     filename_no_year = strip_year_suffix(path.stem)
     parent_no_year = strip_year_suffix(path.parent.name) if path.parent.name != '.' else ""
     
-    filename_tokens_clean = tokenize_path_component(filename_no_year)
-    parent_tokens_clean = tokenize_path_component(parent_no_year)
-    
-    # Try to match entities (priority: parent → filename)
-    candidates: List[Tuple[str, str, str, float]] = []  # (entity, kind, source, score)
-    
-    # Check parent folder first (higher priority)
-    for token in parent_tokens_clean:
-        if is_junk_token(token):
-            continue
-        
-        # Try each dictionary
-        if entity := match_entity_in_token(token, ORG_ENTITIES):
-            candidates.append((entity, "org", "parent", 2.0))
-        
-        if entity := match_entity_in_token(token, PERSON_ENTITIES):
-            candidates.append((entity, "person", "parent", 2.0))
-        
-        if entity := match_entity_in_token(token, PLACE_ENTITIES):
-            candidates.append((entity, "place", "parent", 1.8))
-    
-    # Check filename (lower priority)
-    for token in filename_tokens_clean:
-        if is_junk_token(token):
+    # Try to match entities in fixed precedence and return on the first hit:
+    # parent-org > parent-person > parent-place > filename-org > ...
+    for source, text, scores in (
+        ("parent", parent_no_year, _PARENT_SCORES),
+        ("filename", filename_no_year, _FILENAME_SCORES),
+    ):
+        hits = [
+            (entity, kind)
+            for entity, kind in find_entities(normalize_token(text))
+            if entity not in _JUNK_ENTITIES
+        ]
+        if not hits:
             continue
         
-        if entity := match_entity_in_token(token, ORG_ENTITIES):
-            candidates.append((entity, "org", "filename", 1.5))
-        
-        if entity := match_entity_in_token(token, PERSON_ENTITIES):
-            candidates.append((entity, "person", "filename", 1.5))
-        
-        if entity := match_entity_in_token(token, PLACE_ENTITIES):
-            candidates.append((entity, "place", "filename", 1.3))
+        for wanted in _KIND_PRECEDENCE:
+            for entity, kind in hits:
+                if kind == wanted:
+                    return EntityResult(
+                        domain="",  # Reserved for future use
+                        kind=kind,
+                        entity=canonicalize_entity(entity),
+                        year=year,
+                        confidence=min(scores[kind] / 3.0, 1.0),  # Normalize to 0-1 range
+                        source=source,
+                    )
     
     # No entities found
-    if not candidates:
-        return EntityResult(
-            domain="",
-            kind="none",
-            entity="",
-            year=year,
-            confidence=0.0,
-            source="none",
-        )
-    
-    # Sort by score and pick best
-    candidates.sort(key=lambda x: x[3], reverse=True)
-    best_entity, best_kind, best_source, best_score = candidates[0]
-    
-    # Canonicalize entity
-    canonical_entity = canonicalize_entity(best_entity)
-    
-    # Calculate confidence (0.0-1.0)
-    confidence = min(best_score / 3.0, 1.0)  # Normalize to 0-1 range
-    
     return EntityResult(
-        domain="",  # Reserved for future use
-        kind=best_kind,
-        entity=canonical_entity,
+        domain="",
+        kind="none",
+        entity="",
         year=year,
-        confidence=confidence,
-        source=best_source,
+        confidence=0.0,
+        source="none",
     )
 
 
-def tokenize_path_component(component: str) -> List[str]:
+@lru_cache(maxsize=1 << 16)
+def tokenize_path_component(component: str) -> Tuple[str, ...]:
     """
     Tokenize a path component (filename or folder name).
     
     Splits on: spaces, underscores, dashes, dots
-    Returns lowercase tokens.
+    Returns lowercase tokens as a tuple. Results are cached, and tokens are
+    interned so repeated names across files share one string object.
     """
     if not component:
-        return []
-    
-    # Split on separators
-    tokens = re.split(r'[_\-\.\s]+', component)
+        return ()
     
-    # Clean and filter
-    cleaned = []
-    for token in tokens:
-        token = token.strip()
-        if token and len(token) > 0:
-            cleaned.append(token.lower())
-    
-    return cleaned
+    return tuple(sys.intern(t.lower()) for t in _SEP_RE.split(component) if t)
 
 
 # ============================================================================
@@ -479,25 +619,25 @@ def aggregate_entity_counts(entity_results: List[EntityResult]) -> Dict[str, Dic
     Returns:
         Dict mapping entity_name → {kind, count, example_paths}
     """
-    aggregated: Dict[str, Dict[str, any]] = {}
+    # Accumulate into flat tables and build the per-entity dicts once at the
+    # end, rather than allocating and mutating a nested dict per hit.
+    counts: Counter = Counter()
+    kinds: Dict[str, str] = {}
     
     for er in entity_results:
         if not er.entity or er.kind == "none":
             continue
         
-        if er.entity not in aggregated:
-            aggregated[er.entity] = {
-                "kind": er.kind,
-                "count": 0,
-                "example_paths": [],
-            }
-        
-        aggregated[er.entity]["count"] += 1
-        
-        # Keep up to 5 example paths
-        if len(aggregated[er.entity]["example_paths"]) < 5:
-            # Get source path if available
-            # Note: We'd need to pass result.path here, but for now skip
-            pass
-    
-    return aggregated
+        counts[er.entity] += 1
+        kinds.setdefault(er.entity, er.kind)
+    
+    # Example paths are not tracked yet: EntityResult does not carry the
+    # source path.
+    return {
+        entity: {
+            "kind": kinds[entity],
+            "count": count,
+            "example_paths": [],
+        }
+        for entity, count in counts.items()
+    }
@@ -1,7 +1,7 @@
 import re
 from pathlib import Path
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
 def tokenize_name(p: Path):
-    name = " ".join(p.parts).lower()
-    tokens = re.findall(r"[a-z0-9]+", name)
-    return set(tokens)
+    return {t for part in p.parts for t in _TOKEN_RE.findall(part.lower())}
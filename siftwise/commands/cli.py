@@ -31,6 +31,7 @@ def main():
     p_exec.add_argument("--plan", help="Override plan path (defaults to <dest-root>/.sift/TreePlan.json)")
     p_exec.add_argument("--mapping", help="Override mapping path (defaults to <dest-root>/.sift/Mapping.csv)")
     p_exec.add_argument("--what-if", action="store_true", help="Dry-run only")
+    p_exec.add_argument("--verbose", action="store_true", help="Print every mapping row and file operation")
     # PROMOTE-SUGGESTED (utility)
     p_promote = sub.add_parser(
         "promote-suggested",
@@ -68,6 +69,11 @@ def main():
         choices=["on", "off", "smart"],
         default="smart"
     )
+    p_refine.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run detectors on every residual instead of reusing cached results"
+    )
 
     # Future commands placeholder
     # SEARCH (Phase 3)
@@ -19,7 +19,7 @@ def run(args):
     - No mixing of old/new mapping rows
     """
     from siftwise.state.io import ensure_sift_dir, write_treeplan, write_mapping, write_preview
-    from siftwise.analyze.analyzer import analyze_paths
+    from siftwise.analyze.analyzer import analyze_paths, scan_files
     from siftwise.strategy import build_plan, get_plan_summary
 
     root = Path(args.root).resolve()
@@ -35,12 +35,13 @@ def run(args):
 
     # 1. Collect files
     print(f"[sift] Scanning {root}...")
-    paths = [p for p in root.rglob("*") if p.is_file()]
-    print(f"[sift] Found {len(paths)} files")
+    # FileInfos carry the scan's stat, so the analyzer doesn't stat again
+    files = scan_files(root)
+    print(f"[sift] Found {len(files)} files")
 
     # 2. Run analyzer (first pass)
     print(f"[sift] Analyzing files...")
-    results = analyze_paths(paths=paths, root_out=dest_root, refinement_iteration=1)
+    results = analyze_paths(paths=files, root_out=dest_root, refinement_iteration=1)
 
     # Initial residual report
     residual_count = sum(1 for r in results if getattr(r, "is_residual", False))
@@ -20,6 +20,7 @@ def run(args):
             - plan: optional path to TreePlan.json
             - mapping: optional path to Mapping.csv
             - what_if: dry-run flag (True = no changes)
+            - verbose: print every row/operation instead of a progress counter
     """
     # Resolve destination root
     dest_root = Path(args.dest_root).resolve()
@@ -74,7 +75,14 @@ def run(args):
 
     # Execute the plan using in-memory data
     try:
-        execute_from_plan(plan, mapping_rows, dest_root, what_if=args.what_if)
+        execute_from_plan(
+            plan,
+            mapping_rows,
+            dest_root,
+            what_if=args.what_if,
+            plan_path=plan_path,
+            verbose=getattr(args, "verbose", False),
+        )
     except Exception as e:
         print(f"\n❌ Error during execution: {e}")
         sys.exit(1)
\ No newline at end of file
@@ -5,8 +5,33 @@ Re-analyzes residual files and uses the strategy layer to update
 the plan consistently.
 """
 
+import os
 from pathlib import Path
-import pandas as pd
+from typing import Dict, Set
+
+# IsResidual values that count as true
+_TRUE_VALUES = ("true", "1", "yes", "y")
+
+
+def _exists(path: Path, dir_listings: Dict[Path, Set[str]]) -> bool:
+    """
+    Existence check backed by one os.scandir() per parent directory.
+
+    Residuals cluster in a few folders, so listing each parent once replaces
+    a stat() per file. Names missing from the listing fall back to
+    Path.exists(), which keeps results exact on case-insensitive
+    filesystems.
+    """
+    parent = path.parent
+    names = dir_listings.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            names = set()
+        dir_listings[parent] = names
+    return path.name in names or path.exists()
 
 
 def run(args):
@@ -18,13 +43,21 @@ def run(args):
     - Never touches non-residual decisions
     - Safe to run multiple times
     """
+    import pandas as pd
+
     from siftwise.state.io import (
+        aggregate_entities_from_mapping,
+        apply_entity_diff,
         get_sift_dir,
         load_mapping,
+        load_signal_cache,
+        read_entities_csv,
         update_mapping,
+        write_entities_csv,
         write_residual_summary,
+        write_signal_cache,
     )
-    from siftwise.analyze.analyzer import analyze_paths
+    from siftwise.analyze.analyzer import SIGNAL_CACHE_VERSION, analyze_paths
     from siftwise.strategy import replan_residuals
 
     dest_root = Path(args.dest_root).resolve()
@@ -39,35 +72,49 @@ def run(args):
     mapping_rows = load_mapping(sift_dir)
     print(f"[sift] Loaded {len(mapping_rows)} files from mapping")
 
-    # 2) Filter to residual files only
-    def _is_true(v: str) -> bool:
-        return str(v).strip().lower() in ("true", "1", "yes", "y")
-
-    residual_rows = [row for row in mapping_rows if _is_true(row.get("IsResidual", ""))]
+    # 2) Filter to residual files only (one vectorized pass over the column)
+    df = pd.DataFrame(mapping_rows, columns=["SourcePath", "IsResidual"], dtype=str).fillna("")
+    mask = df["IsResidual"].str.strip().str.lower().isin(_TRUE_VALUES)
+    residual_sources = df.loc[mask, "SourcePath"].tolist()
 
-    if not residual_rows:
+    if not residual_sources:
         print("[sift] No residual files to refine!")
         return
 
-    print(f"[sift] Found {len(residual_rows)} residual files to re-analyze")
+    print(f"[sift] Found {len(residual_sources)} residual files to re-analyze")
 
     # 3) Collect residual file paths
     residual_paths = []
-    for row in residual_rows:
-        path = Path(row["SourcePath"])
-        if path.exists():
+    dir_listings: Dict[Path, Set[str]] = {}
+    for path in map(Path, residual_sources):
+        if _exists(path, dir_listings):
             residual_paths.append(path)
         else:
             print(f"[sift] Warning: file not found: {path}")
 
     print(f"[sift] Re-analyzing {len(residual_paths)} files...")
 
-    # 4) Re-analyze with higher iteration number
+    # 4) Re-analyze with higher iteration number. Detector output for files
+    # unchanged since the last pass comes from <sift_dir>/.residual_cache.
+    use_cache = not getattr(args, "no_cache", False)
+    signal_cache = load_signal_cache(sift_dir, SIGNAL_CACHE_VERSION) if use_cache else None
     results = analyze_paths(
         paths=residual_paths,
         root_out=dest_root,
         refinement_iteration=iteration,
+        signal_cache=signal_cache,
     )
+    if signal_cache is not None:
+        # Keep only this pass's residuals so the cache can't grow unbounded
+        current = {str(p) for p in residual_paths}
+        try:
+            write_signal_cache(
+                sift_dir,
+                {k: v for k, v in signal_cache.items() if k in current},
+                SIGNAL_CACHE_VERSION,
+            )
+        except OSError as e:
+            print(f"[sift] Warning: could not write residual cache: {e}")
 
     # 5) Use strategy layer to update the plan
     print("[sift] Updating plan with refined results...")
@@ -107,6 +154,27 @@ def run(args):
     # 6) Write updated mapping
     update_mapping(sift_dir, updated_plan["mapping_rows"])
 
+    # Keep an exported Entities.csv in step: only residual rows changed, so
+    # diff their old and new entity contributions instead of re-aggregating
+    if (sift_dir / "Entities.csv").exists():
+        # Match by normalized path on both sides: replan_residuals matches
+        # that way and writes re-routed rows with Path-normalized spellings
+        # (a Mapping.csv "a//b" comes back as "a/b")
+        residual_set = {os.path.normpath(s) for s in residual_sources}
+
+        def _is_refined(row: Dict) -> bool:
+            source = row.get("SourcePath")
+            return bool(source) and os.path.normpath(source) in residual_set
+
+        old_rows = [r for r in mapping_rows if _is_refined(r)]
+        new_rows = [r for r in updated_plan["mapping_rows"] if _is_refined(r)]
+        try:
+            entities = apply_entity_diff(read_entities_csv(sift_dir), old_rows, new_rows)
+        except (KeyError, ValueError):
+            # Unreadable or older-format Entities.csv: rebuild it from scratch
+            entities = aggregate_entities_from_mapping(updated_plan["mapping_rows"])
+        write_entities_csv(sift_dir, entities)
+
     # 7) Generate and write summary
     stats = updated_plan["stats"]
 
@@ -134,18 +202,14 @@ def run(args):
     print(f"\n[sift] Updated mapping saved to {sift_dir / 'Mapping.csv'}")
 
     # --- Tip: promote suggested -> move (shows only if Suggest > 0) ---
-    try:
-        mapping_path = sift_dir / "Mapping.csv"
-        df_tip = pd.read_csv(mapping_path)
-
-        if "Action" in df_tip.columns:
-            suggest_count = int((df_tip["Action"] == "Suggest").sum())
-            if suggest_count > 0:
-                print(f"\n[sift] Note: {suggest_count} files are marked Suggest.")
-                print("[sift] Tip: If you're confident, promote all Suggest → Move with:")
-                print(f'[sift]   sift promote-suggested --dest-root "{sift_dir.parent}"')
-    except Exception as e:
-        print(f"[sift] (tip skipped) {e}")
+    # Counted from the rows just written; no need to re-read Mapping.csv
+    suggest_count = sum(
+        1 for row in updated_plan["mapping_rows"] if row.get("Action") == "Suggest"
+    )
+    if suggest_count > 0:
+        print(f"\n[sift] Note: {suggest_count} files are marked Suggest.")
+        print("[sift] Tip: If you're confident, promote all Suggest → Move with:")
+        print(f'[sift]   sift promote-suggested --dest-root "{sift_dir.parent}"')
 
     # Residual guidance
     if stats.get("still_residual", 0) > 0:
@@ -2,6 +2,12 @@ import json, os, sys
 from pathlib import Path
 from ..state.io import get_sift_dir
 
+try:
+    import orjson  # optional accelerator (pip install orjson)
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 def _print_ascii(plan):
     def walk(node_id, nodes_by_id, depth=0):
         node = nodes_by_id[node_id]
@@ -23,7 +29,7 @@ def run(args):
         print(f"Tree plan not found: {tree_path}. Run 'sift draft-structure' first.")
         sys.exit(1)
 
-    plan = json.loads(tree_path.read_text(encoding="utf-8"))
+    plan = _json_loads(tree_path.read_bytes())
     _print_ascii(plan)
 
     if getattr(args, "open_yaml", False) or getattr(args, "open_yml", False):
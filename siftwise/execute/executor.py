@@ -1,11 +1,40 @@
-import csv
+import errno
 import json
+import os
+import pickle
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Tuple, List, Dict, Any
+from typing import Iterable, Tuple, List, Dict, Any, Optional, Set
+
+import numpy as np
+import pandas as pd
+
 from siftwise.execute.journaling import get_journal
 
+try:
+    import orjson  # optional accelerator (pip install orjson)
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Canonical action for each accepted (stripped, lowercased) spelling
+_ACTION_MAP = {
+    "move": "Move",
+    "mv": "Move",
+    "copy": "Copy",
+    "cp": "Copy",
+    "skip": "Skip",
+    "ignore": "Skip",
+    "suggest": "Suggest",
+    "review": "Suggest",
+}
+
+# IsResidual spellings that mean True
+_RESIDUAL_TRUE = frozenset({"true", "1", "yes", "y"})
+
+
 def _normalize_action(action_str: str, is_residual: bool = False) -> str:
     """
     Normalize action string to canonical values.
@@ -16,20 +45,8 @@ def _normalize_action(action_str: str, is_residual: bool = False) -> str:
         # Default to Skip for residuals, Move for non-residuals
         return "Skip" if is_residual else "Move"
 
-    action = action_str.strip().lower()
-
-    # Map to canonical values
-    if action in ("move", "mv"):
-        return "Move"
-    elif action in ("copy", "cp"):
-        return "Copy"
-    elif action in ("skip", "ignore"):
-        return "Skip"
-    elif action in ("suggest", "review"):
-        return "Suggest"
-    else:
-        # Unknown action - safer to skip
-        return "Skip"
+    # Unknown action - safer to skip
+    return _ACTION_MAP.get(action_str.strip().lower(), "Skip")
 
 
 def _normalize_is_residual(residual_str: str) -> bool:
@@ -42,38 +59,160 @@ def _normalize_is_residual(residual_str: str) -> bool:
     if not residual_str:
         return False
 
-    normalized = residual_str.strip().lower()
-    return normalized in ("true", "1", "yes", "y")
+    return residual_str.strip().lower() in _RESIDUAL_TRUE
+
 
+DirListings = Dict[str, Tuple[Set[str], Set[str]]]
 
-def _resolve_collision(dst: Path) -> Tuple[Path, int]:
+
+def _path_exists(path: str, listings: DirListings) -> bool:
     """
-    If dst exists, produce dst with __dupN appended before suffix.
-    Returns (new_path, dup_index). dup_index is 0 if no collision.
+    Existence check backed by one os.scandir() per parent directory.
+
+    `listings` caches {parent: (names, casefolded names)}. A name that only
+    matches case-insensitively falls back to os.path.exists(), so results
+    stay exact on case-insensitive filesystems without a stat() per file.
+    """
+    parent, name = os.path.split(path)
+    listing = listings.get(parent)
+    if listing is None:
+        try:
+            with os.scandir(parent or ".") as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            names = set()  # Destination folders often don't exist yet
+        listing = listings[parent] = (names, {n.casefold() for n in names})
+
+    names, folded = listing
+    if name in names:
+        return True
+    return name.casefold() in folded and os.path.exists(path)
+
+
+def _dedupe_target(
+    dst: str,
+    taken: Set[str],
+    listings: Optional[DirListings] = None,
+    freed: Optional[Set[str]] = None,
+) -> Tuple[str, int]:
+    """
+    String-path core of _resolve_collision, used by the executor hot loop.
+
+    Pass `listings` to check the disk through cached directory listings
+    instead of a stat() per candidate. `freed` holds paths that are on
+    disk now but that earlier planned operations will have moved away;
+    they count as free.
     """
-    if not dst.exists():
+    if listings is None:
+        on_disk = os.path.exists
+    else:
+        def on_disk(path: str) -> bool:
+            return _path_exists(path, listings)
+
+    if freed:
+        def exists(path: str) -> bool:
+            return path not in freed and on_disk(path)
+    else:
+        exists = on_disk
+
+    if dst not in taken and not exists(dst):
         return dst, 0
 
-    parent = dst.parent
-    stem = dst.stem
-    suffix = dst.suffix
+    parent, name = os.path.split(dst)
+    stem, suffix = os.path.splitext(name)
 
     i = 1
     while True:
-        candidate = parent / f"{stem}__dup{i}{suffix}"
-        if not candidate.exists():
+        candidate = os.path.join(parent, f"{stem}__dup{i}{suffix}")
+        if candidate not in taken and not exists(candidate):
             return candidate, i
         i += 1
 
-    # Print summary
-    print("\nLegacy executor summary:")
-    print(f"  Moved: {moved}")
-    print(f"  Copied: {copied}")
-    print(f"  Skipped by action/suggest: {skipped_by_action}")
-    print(f"  Skipped by error: {skipped_by_error}")
-    print(f"  Residuals left in place: {skipped_residuals}")
 
-    return log_path
+def _resolve_collision(dst: Path, taken: Optional[Set[Path]] = None) -> Tuple[Path, int]:
+    """
+    If dst exists, produce dst with __dupN appended before suffix.
+    Returns (new_path, dup_index). dup_index is 0 if no collision.
+
+    `taken` holds destinations already claimed by this run that may not be
+    on disk yet; they count as existing.
+    """
+    final_dst, dup_index = _dedupe_target(str(dst), {str(p) for p in taken or ()})
+    return Path(final_dst), dup_index
+
+
+# Worker threads for file operations; moves and copies are I/O-bound
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Operations submitted at a time; the journal is fsynced after each window,
+# so at most one window of finished operations is ever unrecorded on disk
+_OP_WINDOW = _IO_WORKERS * 8
+
+# Without --verbose, a single progress line is refreshed this often
+_PROGRESS_EVERY = 1000
+
+
+def _report_progress(done: int, total: int) -> None:
+    """Refresh the progress line every _PROGRESS_EVERY operations and at the end."""
+    if done % _PROGRESS_EVERY == 0 or done == total:
+        print(f"[sift] processed {done}/{total}", end="\n" if done == total else "\r", flush=True)
+
+
+def _do_op(
+    op: Tuple[str, str, str], same_device: bool = False
+) -> Tuple[str, str, str, Optional[str]]:
+    """
+    Run one Move/Copy. Returns (src, dst, action, error); error is None on success.
+
+    Runs on a worker thread, so it only touches the filesystem; counting,
+    printing and journaling stay on the calling thread. The destination
+    folder must already exist (see _make_parent_dirs).
+
+    With `same_device`, a Move is a bare os.rename(); shutil.move() is only
+    used across filesystems (or if the rename reports EXDEV anyway).
+    """
+    src, dst, action = op
+    try:
+        if action == "Copy":
+            shutil.copy2(src, dst)
+        elif same_device:
+            try:
+                os.rename(src, dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(src, dst)
+        else:  # Move
+            shutil.move(src, dst)
+    except Exception as e:
+        return src, dst, action, str(e)
+    return src, dst, action, None
+
+
+def _make_parent_dirs(dsts: Iterable[str]) -> Dict[str, str]:
+    """
+    Create each distinct destination folder once.
+
+    Returns {folder: error message} for folders that could not be created.
+    """
+    errors: Dict[str, str] = {}
+    for parent in dict.fromkeys(os.path.dirname(dst) for dst in dsts):
+        try:
+            os.makedirs(parent, exist_ok=True)
+        except Exception as e:
+            errors[parent] = str(e)
+    return errors
+
+
+def _folder_devices(paths: Iterable[str]) -> Dict[str, Optional[int]]:
+    """Map each distinct parent folder of `paths` to its st_dev (None if unknown)."""
+    devices: Dict[str, Optional[int]] = {}
+    for parent in dict.fromkeys(os.path.dirname(path) for path in paths):
+        try:
+            devices[parent] = os.stat(parent or ".").st_dev
+        except OSError:
+            devices[parent] = None
+    return devices
 
 
 def _index_tree_paths(
@@ -83,33 +222,39 @@ def _index_tree_paths(
     Build {node_id: relative_path} mapping from TreePlan.json.
 
     Returns dict mapping node IDs to relative Path objects.
+
+    Walks the tree iteratively (preorder, like the old recursive version)
+    carrying each prefix as a plain string, so deep trees neither hit the
+    recursion limit nor rebuild part lists at every level.
     """
     if idx is None:
         idx = {}
-    if prefix_parts is None:
-        prefix_parts = []
+    prefix = os.path.join(*prefix_parts) if prefix_parts else ""
 
-    # Guard against bad node types
-    if not isinstance(node, dict):
-        raise TypeError(
-            f"_index_tree_paths expected dict node, got {type(node)}: {node!r}"
-        )
+    stack = [(node, prefix)]
+    while stack:
+        node, prefix = stack.pop()
 
-    name = node.get("name", "").strip()
-    node_id = node.get("id")
+        # Guard against bad node types
+        if not isinstance(node, dict):
+            raise TypeError(
+                f"_index_tree_paths expected dict node, got {type(node)}: {node!r}"
+            )
 
-    # Skip including the artificial root name in the path; children hang below dest_root
-    if node_id == "n_root":
-        rel_parts = prefix_parts  # Root stays at destination base
-    else:
-        rel_parts = [*prefix_parts, name] if name else prefix_parts
+        name = node.get("name", "").strip()
+        node_id = node.get("id")
+
+        # Skip including the artificial root name in the path; children hang below dest_root
+        if node_id == "n_root" or not name:
+            rel = prefix  # Root stays at destination base
+        else:
+            rel = os.path.join(prefix, name) if prefix else name
 
-    if node_id:
-        idx[node_id] = Path(*rel_parts) if rel_parts else Path(".")
+        if node_id:
+            idx[node_id] = Path(rel) if rel else Path(".")
 
-    # Recurse into children
-    for child in node.get("children", []):
-        _index_tree_paths(child, rel_parts, idx)
+        # Push children reversed so they pop in document order
+        stack.extend((child, rel) for child in reversed(node.get("children", [])))
 
     return idx
 
@@ -136,28 +281,87 @@ def _index_paths_from_nodes(plan: Dict[str, Any]) -> Dict[str, Path]:
     parent_map = {n["id"]: n.get("parent") for n in nodes if "id" in n}
     name_map = {n["id"]: n.get("name", "") for n in nodes if "id" in n}
 
-    node_paths: Dict[str, Path] = {}
+    # Resolve each node once, reusing its parent's already-resolved path, so
+    # the whole index is O(N) instead of re-walking ancestors per node.
+    rel_paths: Dict[str, str] = {root_id: ""}
 
-    for node_id in id_to_node.keys():
-        if node_id == root_id:
-            node_paths[node_id] = Path(".")
+    for node_id in id_to_node:
+        if node_id in rel_paths:
             continue
 
-        parts: List[str] = []
+        # Climb until we reach a resolved ancestor or the top of the chain
+        chain: List[str] = []
+        seen: Set[str] = set()
         cur_id = node_id
+        while cur_id and cur_id in name_map and cur_id not in rel_paths and cur_id not in seen:
+            chain.append(cur_id)
+            seen.add(cur_id)
+            cur_id = parent_map.get(cur_id)
 
-        # Walk up parents until root
-        while cur_id and cur_id in name_map:
-            if cur_id == root_id:
-                break
-            name = name_map.get(cur_id, "")
+        # Then resolve back down the chain
+        rel = rel_paths.get(cur_id, "") if cur_id else ""
+        for chain_id in reversed(chain):
+            name = name_map.get(chain_id, "")
             if name:
-                parts.append(name)
-            cur_id = parent_map.get(cur_id)
+                rel = os.path.join(rel, name) if rel else name
+            rel_paths[chain_id] = rel
+
+    return {
+        node_id: Path(rel_paths[node_id]) if rel_paths[node_id] else Path(".")
+        for node_id in id_to_node
+    }
+
+
+# Bump when the cached node-path index layout changes
+_INDEX_CACHE_FORMAT = 1
+_INDEX_CACHE_NAME = ".treeplan_index.pickle"
+
+
+def _build_node_paths(plan: Dict[str, Any]) -> Dict[str, Path]:
+    """Index a TreePlan dict in whichever format it uses."""
+    # NEW: handle node-list style plan (your current build_plan format)
+    if "nodes" in plan:
+        print("[sift][debug] using node-list TreePlan format")
+        return _index_paths_from_nodes(plan)
 
-        parts.reverse()
-        node_paths[node_id] = Path(*parts) if parts else Path(".")
+    # Fallback: hierarchical tree with embedded children
+    root_node = plan.get("root", plan)
+    print(f"[sift][debug] root_node type = {type(root_node)}")
+    return _index_tree_paths(root_node)
 
+
+def _cached_node_paths(
+    plan: Dict[str, Any], plan_path: Optional[Path], cache_path: Path
+) -> Dict[str, Path]:
+    """
+    Return the node-path index for `plan`, reusing the pickled copy in
+    `cache_path` while TreePlan.json is unchanged (same path, mtime, size).
+
+    Without a `plan_path` (plan passed in memory) the cache is bypassed.
+    """
+    if plan_path is None:
+        return _build_node_paths(plan)
+
+    try:
+        st = plan_path.stat()
+    except OSError:
+        return _build_node_paths(plan)
+    key = (_INDEX_CACHE_FORMAT, str(plan_path.resolve()), st.st_mtime_ns, st.st_size)
+
+    try:
+        with cache_path.open("rb") as f:
+            cached_key, node_paths = pickle.load(f)
+        if cached_key == key:
+            return node_paths
+    except Exception:
+        pass  # Missing, stale or unreadable cache - rebuild it
+
+    node_paths = _build_node_paths(plan)
+    try:
+        with cache_path.open("wb") as f:
+            pickle.dump((key, node_paths), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Cache is best-effort
     return node_paths
 
 
@@ -166,6 +370,8 @@ def execute_from_plan(
     mapping_rows: List[Dict[str, str]],
     dest_root: Path,
     what_if: bool = False,
+    plan_path: Optional[Path] = None,
+    verbose: bool = False,
 ):
     """
     Execute moves using mapping with accurate counting and robust normalization.
@@ -181,10 +387,32 @@ def execute_from_plan(
         mapping_rows: List of mapping row dicts from Mapping.csv
         dest_root: Destination root directory
         what_if: If True, dry-run mode (no actual file operations)
+        plan_path: TreePlan.json the plan was loaded from; enables the
+            on-disk node-path index cache
+        verbose: If True, print a line per mapping row and per operation;
+            otherwise only errors, a progress counter and the summary
     """
     # NEW: Initialize journal
     journal = get_journal(dest_root)
 
+    # Journal rows are buffered; make sure every buffered row (skips,
+    # collisions, operations) reaches disk even on error or interrupt
+    try:
+        _execute_with_journal(journal, plan, mapping_rows, dest_root, what_if, plan_path, verbose)
+    finally:
+        journal.flush()
+
+
+def _execute_with_journal(
+    journal,
+    plan: Dict[str, Any],
+    mapping_rows: List[Dict[str, str]],
+    dest_root: Path,
+    what_if: bool,
+    plan_path: Optional[Path],
+    verbose: bool,
+):
+    """Body of execute_from_plan; the caller flushes `journal` afterwards."""
     # Extract pass_id early for journaling
     pass_ids = [
         row.get("PassId")
@@ -196,7 +424,7 @@ def execute_from_plan(
     if isinstance(plan, str):
         print("[sift][debug] plan is a string; parsing JSON...")
         try:
-            plan = json.loads(plan)
+            plan = _json_loads(plan.encode("utf-8"))
         except Exception as e:
             raise ValueError(
                 f"Plan must be a dict or JSON string; got str that could not be parsed: {e}"
@@ -205,15 +433,12 @@ def execute_from_plan(
     if not isinstance(plan, dict):
         raise TypeError(f"Plan must be a dict; got {type(plan)}")
 
-    # NEW: handle node-list style plan (your current build_plan format)
-    if "nodes" in plan:
-        print("[sift][debug] using node-list TreePlan format")
-        node_paths = _index_paths_from_nodes(plan)
-    else:
-        # Fallback: hierarchical tree with embedded children
-        root_node = plan.get("root", plan)
-        print(f"[sift][debug] root_node type = {type(root_node)}")
-        node_paths = _index_tree_paths(root_node)
+    # Prepare filesystem
+    dest_root.mkdir(parents=True, exist_ok=True)
+
+    # The journal has already created <dest_root>/.sift
+    index_cache = dest_root / ".sift" / _INDEX_CACHE_NAME
+    node_paths = _cached_node_paths(plan, plan_path, index_cache)
 
     # Ensure root exists
     if "n_root" not in node_paths:
@@ -223,101 +448,84 @@ def execute_from_plan(
     if "n_uncategorized" not in node_paths:
         node_paths["n_uncategorized"] = Path("Uncategorized")
 
-    # Prepare filesystem
-    dest_root.mkdir(parents=True, exist_ok=True)
-
     start_time = datetime.now()
 
     # Prepare operation lists and counters
-    operations: List[Tuple[Path, Path, str]] = []
-
-    skipped_residuals = 0
-    skipped_by_action = 0
-    suggested = 0
     collision_renames = 0
 
     print("Reading mapping rows from memory...")
-    row_count = 0
-
-    for row in mapping_rows:
-        row_count += 1
-
-        # Skip empty rows
-        source_path = (row.get("SourcePath") or "").strip()
-        if not source_path:
-            continue
-
-        # Skip header row if it somehow got duplicated
-        if source_path == "SourcePath":
-            continue
-
-        src = Path(source_path)
-
-        # Normalize IsResidual
-        is_residual = _normalize_is_residual(row.get("IsResidual", ""))
-
-        # Normalize Action
-        action = _normalize_action(row.get("Action", ""), is_residual)
-
-        # Decision logic (Run Protocol v1: trust the mapping)
-        if is_residual:
-            skipped_residuals += 1
-            if what_if:
-                print(f"[residual] Will leave in place: {src}")
-            else:
-                journal.log_skip(src, "Residual - left in place", pass_id)  # NEW
-            continue
-
-        if action in ("Skip", "Suggest"):
-            if action == "Suggest":
-                suggested += 1
-            else:
-                skipped_by_action += 1
-
-            if not what_if:
-                journal.log_skip(src, f"Action={action}", pass_id)  # NEW
-
-            if what_if:
-                print(f"[{action.lower()}] Will skip: {src}")
-            continue
-        if is_residual:
+    row_count = len(mapping_rows)
+
+    # Decide every row at once (Run Protocol v1: trust the mapping)
+    df = pd.DataFrame(
+        mapping_rows, columns=["SourcePath", "IsResidual", "Action", "TargetPath"], dtype=object
+    ).fillna("").astype(str)
+
+    # Skip empty rows, and the header row if it somehow got duplicated
+    source = df["SourcePath"].str.strip()
+    valid = (source != "") & (source != "SourcePath")
+
+    is_residual = df["IsResidual"].str.strip().str.lower().isin(_RESIDUAL_TRUE)
+
+    # Missing action: Skip for residuals, Move otherwise; unknown action: Skip
+    action = df["Action"].str.strip().str.lower().map(_ACTION_MAP).fillna("Skip")
+    action = action.mask(df["Action"] == "", np.where(is_residual, "Skip", "Move"))
+
+    target = df["TargetPath"].str.strip()
+
+    residual_rows = valid & is_residual
+    decided = valid & ~is_residual
+    suggest_rows = decided & (action == "Suggest")
+    skip_rows = decided & (action == "Skip")
+    op_rows = decided & action.isin(["Move", "Copy"])
+    no_target_rows = op_rows & (target == "")
+    op_rows &= ~no_target_rows
+
+    skipped_residuals = int(residual_rows.sum())
+    suggested = int(suggest_rows.sum())
+    skipped_no_target = int(no_target_rows.sum())
+    skipped_by_action = int(skip_rows.sum()) + skipped_no_target
+
+    # Report/journal the rows that will not be executed, in mapping order
+    kind = pd.Series("", index=df.index)
+    kind[residual_rows] = "residual"
+    kind[suggest_rows | skip_rows] = "skip"
+    kind[no_target_rows] = "no_target"
+    # Rows without a TargetPath are always reported; the rest only need a
+    # pass when they are journaled or printed
+    noted = (kind != "") if verbose or not what_if else no_target_rows
+    for src, row_kind, row_action in zip(source[noted], kind[noted], action[noted]):
+        if row_kind == "residual":
             # Residuals ALWAYS stay in place
-            skipped_residuals += 1
-            if what_if:
+            if not what_if:
+                journal.log_skip(src, "Residual - left in place", pass_id)
+            elif verbose:
                 print(f"[residual] Will leave in place: {src}")
-            continue
-
-        if action in ("Skip", "Suggest"):
+        elif row_kind == "skip":
             # Explicit skip/suggest actions
-            if action == "Suggest":
-                suggested += 1
-            else:
-                skipped_by_action += 1
-
-            if what_if:
-                print(f"[{action.lower()}] Will skip: {src}")
-            continue
-
-        if action in ("Move", "Copy"):
+            if not what_if:
+                journal.log_skip(src, f"Action={row_action}", pass_id)
+            elif verbose:
+                print(f"[{row_action.lower()}] Will skip: {src}")
+        else:
             # Run Protocol v1: Use TargetPath from mapping, never invent it
-            target_path_str = (row.get("TargetPath") or "").strip()
-
-            if not target_path_str:
-                # No TargetPath provided - cannot execute
-                print(f"[skip] No TargetPath in mapping for: {src}")
-                skipped_by_action += 1
-                continue
-
-            dst = Path(target_path_str)
-
-            # Validate TargetPath is absolute or make it relative to dest_root
-            if not dst.is_absolute():
-                dst = dest_root / dst
-
-            operations.append((src, dst, action))
+            print(f"[skip] No TargetPath in mapping for: {src}")
+
+    # Operations are three parallel object arrays of plain strings (shutil,
+    # printing and the journal all take strings) rather than a list of
+    # per-file tuples/Paths
+    op_src = source[op_rows].to_numpy()
+    op_action = action[op_rows].to_numpy()
+    # Validate TargetPath is absolute or make it relative to dest_root;
+    # normpath keeps equal targets equal for collision tracking
+    dest_root_str = str(dest_root)
+    op_dst = np.array(
+        [os.path.normpath(os.path.join(dest_root_str, t)) for t in target[op_rows]],
+        dtype=object,
+    )
 
     print(f"Processed {row_count} mapping entries")
-    print(f"  - {len(operations)} files to process")
+    print(f"  - {len(op_src)} files to process")
     print(f"  - {skipped_residuals} residuals to leave in place")
     print(f"  - {skipped_by_action} files to skip by action")
     print(f"  - {suggested} files suggested (not executed)\n")
@@ -327,48 +535,91 @@ def execute_from_plan(
     copied = 0
     skipped_by_error = 0
 
-    for src, dst, action in operations:
+    # Pre-pass (serial): source checks and collision resolution. Targets
+    # claimed earlier in this run count as taken, because operations run
+    # concurrently and may not have landed on disk yet.
+    ready: List[Tuple[str, str, str]] = []
+    claimed: Set[str] = set()
+    # One directory listing per source/destination folder instead of a
+    # stat() per file
+    listings: DirListings = {}
+
+    for src, dst, action in zip(op_src, op_dst, op_action):
         # Check source exists
-        if not src.exists():
+        if not _path_exists(src, listings):
             print(f"[skip] missing source: {src}")
             skipped_by_error += 1
             continue
 
         # Collision handling: never overwrite, never silently skip
-        final_dst, dup_index = _resolve_collision(dst)
+        final_dst, dup_index = _dedupe_target(dst, claimed, listings)
+        claimed.add(final_dst)
         if dup_index > 0:
             collision_renames += 1
-            print(f"[collision] target exists, renaming -> {final_dst.name}")
+            if verbose:
+                print(f"[collision] target exists, renaming -> {os.path.basename(final_dst)}")
         if not what_if:
             journal.log_collision(src, dst, final_dst, dup_index, pass_id)
-        # Print action
-        if what_if:
-            print(f"DRY: {action} {src}  ->  {final_dst}")
-        else:
-            print(f"{action.upper()}: {src}  ->  {final_dst}")
 
-        if not what_if:
-            final_dst.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                if action == "Copy":
-                    shutil.copy2(str(src), str(final_dst))
-                    copied += 1
-                    journal.log_copy(src, final_dst, pass_id)
-                else:  # Move
-                    shutil.move(str(src), str(final_dst))
-                    moved += 1
-                    journal.log_move(src, final_dst, pass_id)
-
-            except Exception as e:
-                print(f"  ERROR: {e}")
-                skipped_by_error += 1
-                journal.log_error(src, final_dst, str(e), pass_id)
-        else:
-            # In dry run, count what would happen
+        ready.append((src, final_dst, action))
+
+    if what_if:
+        # In dry run, count what would happen
+        for done, (src, final_dst, action) in enumerate(ready, 1):
+            if verbose:
+                print(f"DRY: {action} {src}  ->  {final_dst}")
+            else:
+                _report_progress(done, len(ready))
             if action == "Copy":
                 copied += 1
             else:
                 moved += 1
+    else:
+        # mkdir once per destination folder, before the workers start,
+        # instead of once per file from racing threads
+        dir_errors = _make_parent_dirs(dst for _, dst, _ in ready)
+
+        # One stat per folder tells which moves can be a plain rename
+        devices = _folder_devices(path for src, dst, _ in ready for path in (src, dst))
+
+        def run_op(op: Tuple[str, str, str]) -> Tuple[str, str, str, Optional[str]]:
+            src_dev = devices[os.path.dirname(op[0])]
+            dst_parent = os.path.dirname(op[1])
+            error = dir_errors.get(dst_parent)
+            if error is not None:
+                return (*op, error)
+            return _do_op(op, same_device=src_dev is not None and src_dev == devices[dst_parent])
+
+        # Run moves/copies on a thread pool, one window at a time; results
+        # come back in submission order, so output and journal stay
+        # deterministic.
+        done = 0
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as pool:
+            try:
+                for start in range(0, len(ready), _OP_WINDOW):
+                    results = pool.map(run_op, ready[start:start + _OP_WINDOW])
+                    for src, final_dst, action, error in results:
+                        done += 1
+                        if verbose or error is not None:
+                            print(f"{action.upper()}: {src}  ->  {final_dst}")
+                        if error is not None:
+                            print(f"  ERROR: {error}")
+                            skipped_by_error += 1
+                            journal.log_error(src, final_dst, error, pass_id)
+                        elif action == "Copy":
+                            copied += 1
+                            journal.log_copy(src, final_dst, pass_id)
+                        else:
+                            moved += 1
+                            journal.log_move(src, final_dst, pass_id)
+                        if not verbose:
+                            _report_progress(done, len(ready))
+                    # The window's records are on disk before more files move
+                    journal.sync()
+            except BaseException:
+                # E.g. the journal failed: start no more operations
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
 
     # Calculate totals
     skipped_action_total = skipped_by_action + suggested
@@ -391,6 +642,7 @@ def execute_from_plan(
     print(f"  Moved:                    {moved}")
     print(f"  Copied:                   {copied}")
     print(f"  Skipped (action/suggest): {skipped_action_total}")
+    print(f"    of which no TargetPath: {skipped_no_target}")
     print(f"  Skipped (errors):         {skipped_by_error}")
     print(f"  Skipped (total):          {total_skipped}")
     print(f"  Residuals left in place:  {skipped_residuals}")
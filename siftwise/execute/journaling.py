@@ -6,9 +6,12 @@ for undo/audit trail.
 """
 
 import csv
+import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, List, TextIO, Tuple
 
 
 class Journal:
@@ -25,9 +28,32 @@ class Journal:
     - PassId: Which pass/iteration this was
     """
 
+    FIELDNAMES = (
+        'Timestamp', 'Operation', 'SourcePath', 'DestPath',
+        'Status', 'Details', 'PassId'
+    )
+
+    # Buffered rows are handed to the writer thread once this many accumulate
+    FLUSH_EVERY = 1000
+
+    # Rows recording a real filesystem change; undo needs them, so they are
+    # written straight through instead of buffered
+    WRITE_THROUGH = frozenset({'Move', 'Copy'})
+
+    # Batches the writer thread may lag behind before log() blocks
+    MAX_QUEUED_BATCHES = 8
+
     def __init__(self, journal_path: Path):
         self.path = journal_path
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._pending: List[Tuple[str, ...]] = []
+        self._queue: "queue.Queue[Optional[List[Tuple[str, ...]]]]" = queue.Queue(
+            maxsize=self.MAX_QUEUED_BATCHES
+        )
+        self._writer: Optional[threading.Thread] = None
+        self._writer_error: Optional[BaseException] = None
+        # Append handle for write-through rows, opened on first use
+        self._file: Optional[TextIO] = None
 
         # Create with header if doesn't exist
         if not self.path.exists():
@@ -35,11 +61,7 @@ class Journal:
 
     def _write_header(self):
         with self.path.open('w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'Timestamp', 'Operation', 'SourcePath', 'DestPath',
-                'Status', 'Details', 'PassId'
-            ])
-            writer.writeheader()
+            csv.writer(f).writerow(self.FIELDNAMES)
 
     def log(
             self,
@@ -50,22 +72,101 @@ class Journal:
             details: str = '',
             pass_id: Optional[int] = None,
     ):
-        """Log a single operation."""
-        with self.path.open('a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=[
-                'Timestamp', 'Operation', 'SourcePath', 'DestPath',
-                'Status', 'Details', 'PassId'
-            ])
-
-            writer.writerow({
-                'Timestamp': datetime.now().isoformat(),
-                'Operation': operation,
-                'SourcePath': str(source_path),
-                'DestPath': str(dest_path) if dest_path else '',
-                'Status': status,
-                'Details': details,
-                'PassId': str(pass_id) if pass_id else '',
-            })
+        """
+        Log a single operation.
+
+        WRITE_THROUGH rows (and any rows buffered before them) are written
+        before this returns, so a crash cannot lose the record of a file
+        that was moved. Other rows are buffered and every FLUSH_EVERY rows
+        are appended by a background writer thread, so file I/O overlaps
+        with the caller's work. Call sync() to also fsync, and flush() when
+        done.
+
+        Raises as soon as the writer thread has failed, so callers stop
+        changing files once they can no longer be journaled.
+        """
+        self._raise_writer_error()
+        self._pending.append((
+            datetime.now().isoformat(),
+            operation,
+            str(source_path),
+            str(dest_path) if dest_path else '',
+            status,
+            details,
+            str(pass_id) if pass_id else '',
+        ))
+        if operation in self.WRITE_THROUGH:
+            self._write_pending()
+        elif len(self._pending) >= self.FLUSH_EVERY:
+            self._submit()
+
+    def _submit(self):
+        """Queue the buffered rows for the writer thread (starting it if needed)."""
+        batch, self._pending = self._pending, []
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._drain, name='sift-journal-writer', daemon=True
+            )
+            self._writer.start()
+        self._queue.put(batch)
+
+    def _raise_writer_error(self):
+        """Re-raise the writer thread's error, if it hit one."""
+        if self._writer_error is not None:
+            raise self._writer_error
+
+    def _join_writer(self):
+        """Send the writer thread its sentinel and wait for queued batches."""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def _write_pending(self):
+        """Append the buffered rows from this thread, after any queued batches."""
+        self._join_writer()
+        self._raise_writer_error()
+        if self._file is None:
+            self._file = self.path.open('a', newline='', encoding='utf-8')
+        batch, self._pending = self._pending, []
+        csv.writer(self._file).writerows(batch)
+        self._file.flush()
+
+    def sync(self):
+        """Write out all buffered rows and fsync the journal."""
+        self._write_pending()
+        os.fsync(self._file.fileno())
+
+    def _drain(self):
+        """Writer thread: append queued batches until the None sentinel."""
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                return
+            if self._writer_error is not None:
+                continue  # Keep draining so producers never block
+            try:
+                with self.path.open('a', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerows(batch)
+            except BaseException as e:
+                self._writer_error = e
+
+    def flush(self):
+        """
+        Write out all buffered rows and wait for the writer thread to finish.
+
+        Re-raises any error the writer thread hit.
+        """
+        if self._pending:
+            self._submit()
+        self._join_writer()
+        if self._file is not None:
+            try:
+                os.fsync(self._file.fileno())
+            finally:
+                self._file.close()
+                self._file = None
+        self._raise_writer_error()
 
     def log_move(self, source: Path, dest: Path, pass_id: Optional[int] = None):
         """Log a successful move operation."""
@@ -84,7 +185,10 @@ class Journal:
             pass_id: Optional[int] = None,
     ):
         """Log a collision rename."""
-        details = f'Collision: {original_dest.name} → {renamed_dest.name} (dup_index={dup_index})'
+        details = (
+            f'Collision: {os.path.basename(original_dest)} → {os.path.basename(renamed_dest)} '
+            f'(dup_index={dup_index})'
+        )
         self.log('Collision', source, renamed_dest, 'Renamed', details, pass_id)
 
     def log_skip(self, source: Path, reason: str, pass_id: Optional[int] = None):
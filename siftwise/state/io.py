@@ -2,8 +2,86 @@ from pathlib import Path
 from typing import Dict, Any, List
 import csv
 import json
+import pickle
 from siftwise.schemas import MAPPING_CSV_FIELDS, RoutingDecision
 
+try:
+    import pyarrow as pa  # optional accelerator (pip install pyarrow)
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+try:
+    import orjson  # optional accelerator (pip install orjson)
+    _json_loads = orjson.loads
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_indented(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _mapping_parquet_path(csv_path: Path) -> Path:
+    """Mapping.parquet sits next to Mapping.csv (same stem)."""
+    return csv_path.with_suffix(".parquet")
+
+
+# Schema metadata key holding the (size, mtime_ns) of the mirrored CSV
+_CSV_STAT_KEY = b"siftwise.csv_stat"
+
+
+def _csv_stat_value(csv_path: Path) -> bytes:
+    st = csv_path.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}".encode("ascii")
+
+
+def _write_mapping_parquet(csv_path: Path, fieldnames: List[str], rows: List[Dict[str, Any]]) -> None:
+    """
+    Mirror a freshly written Mapping.csv as Mapping.parquet.
+
+    Columns are stored as strings, exactly as they appear in the CSV, so
+    either file loads to the same rows. The CSV's size and mtime are stored
+    in the schema metadata to tell later whether the mirror still matches.
+    No-op when pyarrow is not installed.
+    """
+    if pa is None:
+        return
+
+    columns = {
+        name: ["" if row.get(name) is None else str(row.get(name)) for row in rows]
+        for name in fieldnames
+    }
+    schema = pa.schema(
+        [(name, pa.string()) for name in fieldnames],
+        metadata={_CSV_STAT_KEY: _csv_stat_value(csv_path)},
+    )
+    pq.write_table(pa.table(columns, schema=schema), _mapping_parquet_path(csv_path))
+
+
+def _fresh_mapping_parquet(csv_path: Path) -> Path | None:
+    """
+    Return Mapping.parquet if it can stand in for Mapping.csv, else None.
+
+    The CSV stays the source of truth: the parquet is only used while the
+    CSV has exactly the size and mtime recorded when the mirror was
+    written. Any edit, or an older copy restored over it, falls back to the
+    CSV.
+    """
+    if pq is None:
+        return None
+    parquet_path = _mapping_parquet_path(csv_path)
+    try:
+        metadata = pq.read_schema(parquet_path).metadata or {}
+        if metadata.get(_CSV_STAT_KEY) == _csv_stat_value(csv_path):
+            return parquet_path
+    except (OSError, pa.ArrowException):
+        pass
+    return None
+
 
 def ensure_sift_dir(dest_root: Path, archive_existing: bool = False):
     sift_dir = dest_root / ".sift"
@@ -80,6 +158,8 @@ def write_mapping(sift_dir: Path, rows: List[Dict[str, Any]]) -> Path:
             normalized = {name: row.get(name, "") for name in fieldnames}
             writer.writerow(normalized)
 
+    _write_mapping_parquet(path, fieldnames, rows)
+
     print(f"[sift] wrote Mapping.csv -> {path}")
     return path
 
@@ -100,8 +180,7 @@ def write_residual_summary(sift_dir: Path, summary: Dict[str, Any]) -> Path:
     Write a residual summary JSON used by refine-residuals.
     """
     path = sift_dir / "ResidualSummary.json"
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2)
+    path.write_bytes(_json_dumps_indented(summary))
     print(f"[sift] wrote ResidualSummary.json -> {path}")
     return path
 
@@ -125,15 +204,20 @@ from typing import Dict, Any
 
 def load_treeplan(sift_dir: Path, override_path: str | None = None) -> Dict[str, Any]:
     path = Path(override_path) if override_path else sift_dir / "TreePlan.json"
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _json_loads(path.read_bytes())
 
 def load_mapping(sift_dir: Path, override_path: str | None = None) -> List[Dict[str, str]]:
     """
     Load Mapping.csv (or a custom mapping path) from the sift dir.
+
+    Reads the Mapping.parquet mirror instead when it is up to date.
     """
     path = Path(override_path) if override_path else (sift_dir / "Mapping.csv")
 
+    parquet_path = _fresh_mapping_parquet(path)
+    if parquet_path is not None:
+        return pq.read_table(parquet_path).to_pylist()
+
     rows: List[Dict[str, str]] = []
     with path.open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
@@ -168,6 +252,33 @@ def read_preview(sift_dir: Path, override_path: str | None = None) -> Dict[str,
         return json.load(f)
 
 
+def _signal_cache_path(sift_dir: Path) -> Path:
+    return sift_dir / ".residual_cache" / "signals.pickle"
+
+
+def load_signal_cache(sift_dir: Path, version: int) -> Dict[str, Any]:
+    """
+    Load the per-file detector-signal cache used by refine-residuals.
+
+    Safe if the file is missing, unreadable or from another cache version:
+    returns {}.
+    """
+    try:
+        with _signal_cache_path(sift_dir).open("rb") as f:
+            stored_version, cache = pickle.load(f)
+    except Exception:
+        return {}
+    return cache if stored_version == version else {}
+
+
+def write_signal_cache(sift_dir: Path, cache: Dict[str, Any], version: int) -> Path:
+    path = _signal_cache_path(sift_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        pickle.dump((version, cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
 def update_mapping(
     sift_dir: Path,
     rows: List[Dict[str, Any]],
@@ -204,6 +315,8 @@ def update_mapping(
             normalized = {name: row.get(name, "") for name in fieldnames}
             writer.writerow(normalized)
 
+    _write_mapping_parquet(path, fieldnames, rows)
+
     print(f"[sift] updated Mapping.csv -> {path}")
     return path
 
@@ -291,6 +404,50 @@ def read_entities_csv(sift_dir: Path) -> Dict[str, Dict[str, Any]]:
     return entities_data
 
 
+def _infer_entity_kind(entity: str) -> str:
+    """
+    Determine kind from context (org/person/place/year).
+
+    In v1, we'll use simple heuristics since kind isn't in Mapping.csv yet.
+    """
+    kind = "unknown"
+
+    # Try to infer kind from entity characteristics
+    if entity.isupper() and len(entity) <= 4:
+        kind = "org"  # Likely acronym
+    elif any(char.isdigit() for char in entity):
+        kind = "project"  # Contains numbers, likely project code
+    elif entity.istitle():
+        kind = "person"  # TitleCase, likely person/place
+
+    return kind
+
+
+def _add_entity_row(entity_counts: Dict[str, Dict[str, Any]], row: Dict[str, Any]) -> None:
+    """Add one mapping row's contribution to entity_counts."""
+    # Extract entity from row
+    entity = (row.get("Entity") or "").strip()
+
+    if not entity:
+        return
+
+    # Initialize or update count
+    if entity not in entity_counts:
+        entity_counts[entity] = {
+            "kind": _infer_entity_kind(entity),
+            "count": 0,
+            "example_paths": [],
+        }
+
+    entity_counts[entity]["count"] += 1
+
+    # Add example path (max 5)
+    if len(entity_counts[entity]["example_paths"]) < 5:
+        source_path = row.get("SourcePath", "")
+        if source_path and source_path not in entity_counts[entity]["example_paths"]:
+            entity_counts[entity]["example_paths"].append(source_path)
+
+
 def aggregate_entities_from_mapping(mapping_rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """
     Aggregate entity counts from Mapping.csv rows.
@@ -306,38 +463,42 @@ def aggregate_entities_from_mapping(mapping_rows: List[Dict[str, Any]]) -> Dict[
     entity_counts: Dict[str, Dict[str, Any]] = {}
 
     for row in mapping_rows:
-        # Extract entity from row
-        entity = row.get("Entity", "").strip()
+        _add_entity_row(entity_counts, row)
+
+    return entity_counts
 
-        if not entity:
+
+def apply_entity_diff(
+    entity_counts: Dict[str, Dict[str, Any]],
+    old_rows: List[Dict[str, Any]],
+    new_rows: List[Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Update aggregated entity counts in place for rows that were replaced.
+
+    Subtracts each of `old_rows`' contributions and adds `new_rows`', so a
+    refinement pass costs O(changed rows) instead of re-aggregating the
+    whole mapping. Entities whose count drops to zero are removed.
+
+    Returns:
+        The updated entity_counts
+    """
+    for row in old_rows:
+        entity = (row.get("Entity") or "").strip()
+        data = entity_counts.get(entity)
+        if not entity or data is None:
             continue
 
-        # Determine kind from context (org/person/place/year)
-        # In v1, we'll use simple heuristics since kind isn't in Mapping.csv yet
-        kind = "unknown"
-
-        # Try to infer kind from entity characteristics
-        if entity.isupper() and len(entity) <= 4:
-            kind = "org"  # Likely acronym
-        elif any(char.isdigit() for char in entity):
-            kind = "project"  # Contains numbers, likely project code
-        elif entity.istitle():
-            kind = "person"  # TitleCase, likely person/place
-
-        # Initialize or update count
-        if entity not in entity_counts:
-            entity_counts[entity] = {
-                "kind": kind,
-                "count": 0,
-                "example_paths": [],
-            }
+        data["count"] -= 1
+        if data["count"] <= 0:
+            del entity_counts[entity]
+            continue
 
-        entity_counts[entity]["count"] += 1
+        source_path = row.get("SourcePath", "")
+        if source_path in data["example_paths"]:
+            data["example_paths"].remove(source_path)
 
-        # Add example path (max 5)
-        if len(entity_counts[entity]["example_paths"]) < 5:
-            source_path = row.get("SourcePath", "")
-            if source_path and source_path not in entity_counts[entity]["example_paths"]:
-                entity_counts[entity]["example_paths"].append(source_path)
+    for row in new_rows:
+        _add_entity_row(entity_counts, row)
 
     return entity_counts
@@ -26,6 +26,7 @@ from siftwise.analyze.entities import extract_entities_for_result
 from .rules_engine import (
     load_rules,
     apply_rules,
+    apply_rules_batch,
     get_builtin_rules,
     validate_rules,
     create_rule_from_search,
@@ -34,6 +35,7 @@ from .rules_engine import (
 from .preserve import compute_preserve_mode
 
 from .search import (
+    MappingTable,
     search_mapping,
     search_by_pattern,
     search_residuals,
@@ -57,11 +59,13 @@ __all__ = [
     # Rules engine
     'load_rules',
     'apply_rules',
+    'apply_rules_batch',
     'get_builtin_rules',
     'validate_rules',
     'create_rule_from_search',
 
     # Search
+    'MappingTable',
     'search_mapping',
     'search_by_pattern',
     'search_residuals',
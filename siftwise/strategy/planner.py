@@ -10,13 +10,14 @@ Implements:
 This file is a stable, spec-aligned planner for Siftwise v1.
 """
 
+import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Iterable, Tuple
 import re
 from datetime import datetime
 
 from siftwise.schemas import FileResult, RoutingDecision
-from siftwise.strategy.rules_engine import load_rules, apply_rules
+from siftwise.strategy.rules_engine import load_rules, apply_rules, apply_rules_batch
 
 
 # ============================================================================
@@ -192,9 +193,53 @@ def route_file(
     7-Step Routing Algorithm with Rules Integration.
     Returns routing result with Domain, Kind, Entity, Year, etc.
     """
+    routed = _route_before_rules(result, root)
+
+    # Apply rules if provided
+    rule_outcome = None
+    if rules:
+        rule_outcome = apply_rules(
+            result=result,
+            current_label=_rules_label(routed),
+            current_action=routed["action"],
+            entities=_rules_entities(routed),
+            rules=rules
+        )
+
+    return _finish_route(routed, rule_outcome)
+
+
+def route_files(
+    results: List[FileResult],
+    root: Optional[Path] = None,
+    rules: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    route_file() over many results, applying rules as one batch
+    (see apply_rules_batch). Returns routing results in input order.
+    """
+    routed_list = [_route_before_rules(result, root) for result in results]
+
+    if not rules:
+        return [_finish_route(routed, None) for routed in routed_list]
+
+    rule_outcomes = apply_rules_batch(
+        results,
+        [_rules_label(routed) for routed in routed_list],
+        [routed["action"] for routed in routed_list],
+        [_rules_entities(routed) for routed in routed_list],
+        rules,
+    )
+    return [
+        _finish_route(routed, rule_outcome)
+        for routed, rule_outcome in zip(routed_list, rule_outcomes)
+    ]
+
+
+def _route_before_rules(result: FileResult, root: Optional[Path]) -> Dict[str, Any]:
+    """Routing steps up to (not including) rules; inputs for _finish_route."""
     path = result.path
     label = result.label
-    confidence = result.confidence
 
     tokens, parent_tokens = extract_tokens(path, root)
 
@@ -209,38 +254,61 @@ def route_file(
     prefix = build_prefix(domain, kind, entity, year)
 
     # Determine action (strategy layer owns this)
-    action, is_residual = determine_action(confidence, result.is_residual, label)
+    action, is_residual = determine_action(result.confidence, result.is_residual, label)
 
-    # Apply rules if provided
-    if rules:
-        entities_list = [entity] if entity else []
-        domain_override, action_override = apply_rules(
-            result=result,
-            current_label=domain or "Archive",
-            current_action=action,
-            entities=entities_list,
-            rules=rules
-        )
+    return {
+        "result": result,
+        "tokens": tokens,
+        "domain": domain,
+        "kind": kind,
+        "entity": entity,
+        "year": year,
+        "prefix": prefix,
+        "action": action,
+        "is_residual": is_residual,
+    }
+
+
+def _rules_label(routed: Dict[str, Any]) -> str:
+    return routed["domain"] or "Archive"
+
+
+def _rules_entities(routed: Dict[str, Any]) -> List[str]:
+    return [routed["entity"]] if routed["entity"] else []
+
+
+def _finish_route(
+    routed: Dict[str, Any],
+    rule_outcome: Optional[Tuple[str, Optional[str]]],
+) -> Dict[str, Any]:
+    """Apply a rules outcome (None when rules are off) and build the routing result."""
+    result = routed["result"]
+    domain = routed["domain"]
+    action = routed["action"]
+    kind, entity, year, prefix = routed["kind"], routed["entity"], routed["year"], routed["prefix"]
+
+    if rule_outcome is not None:
+        domain_override, action_override = rule_outcome
         if domain_override != (domain or "Archive"):
             domain = domain_override
         if action_override:
             action = action_override
 
-    why = build_why(domain, kind, entity, year, label, tokens)
+    why = build_why(domain, kind, entity, year, result.label, routed["tokens"])
 
-    if rules and domain_override:
+    if rule_outcome is not None and domain_override:
         why += " [rules applied]"
 
     return {
-        "source_path": str(path),
+        "source_path": str(result.path),
         "domain": domain,
         "kind": kind,
         "entity": entity,
         "year": year,
         "semantic_prefix": str(prefix) if prefix else "",
-        "confidence": confidence,
+        "confidence": result.confidence,
         "action": action,
-        "is_residual": is_residual,
+        "is_residual": routed["is_residual"],
         "why": why,
     }
 
@@ -501,8 +569,8 @@ def build_plan(results: Iterable[FileResult], dest_root: Path, config: Dict[str,
 
     mapping_rows: List[Dict[str, Any]] = []
 
-    for result in results:
-        routed = route_file(result, scan_root, rules)
+    # Rules are applied to all files as one batch
+    for routed in route_files(list(results), scan_root, rules):
         source_path = Path(routed["source_path"])
 
         target_path = build_target_path(
@@ -602,7 +670,13 @@ def replan_residuals(
     def _is_true(v: Any) -> bool:
         return str(v).strip().lower() in ("true", "1", "yes", "y")
 
-    original_by_path = {row["SourcePath"]: row for row in mapping_rows if row.get("SourcePath")}
+    # Residual rows keyed by normalized SourcePath, so "a//b" or "./a" in the
+    # mapping still match the analyzer's Path-derived strings
+    residual_by_path = {
+        os.path.normpath(row["SourcePath"]): row
+        for row in mapping_rows
+        if row.get("SourcePath") and _is_true(row.get("IsResidual"))
+    }
     updated_mapping: List[Dict[str, Any]] = []
 
     reclassified = 0
@@ -612,14 +686,17 @@ def replan_residuals(
     if (preserve_mode or "").upper() == "SMART":
         folder_coherence = compute_folder_coherence(mapping_rows, scan_root)
 
+    # Only results for residual rows are re-routed; rules run as one batch
+    matched = []
     for result in updated_results:
-        source_path = str(result.path)
-        original = original_by_path.get(source_path)
+        original = residual_by_path.get(os.path.normpath(str(result.path)))
+        if original:
+            matched.append((result, original))
 
-        if not original or not _is_true(original.get("IsResidual")):
-            continue
+    routed_list = route_files([result for result, _ in matched], scan_root, rules)
 
-        routed = route_file(result, scan_root, rules)
+    for (result, original), routed in zip(matched, routed_list):
+        source_path = str(result.path)
 
         target_path = build_target_path(
             routed,
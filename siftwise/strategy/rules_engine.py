@@ -5,10 +5,419 @@ Provides a flexible system for applying user-defined rules that can override
 analyzer decisions. V1 is simple but extensible to support YAML/JSON rules.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Callable, Dict, Any, Iterable, Optional, List, Sequence, Set, Tuple
+import copy
+import json
+import os
 import re
 
+try:
+    import ahocorasick  # optional accelerator (pip install pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # optional accelerator (pip install google-re2)
+except ImportError:
+    re2 = None
+
+
+_GLOB_WILDCARDS = {'*': '.*', '?': '.'}
+
+
+@lru_cache(maxsize=1024)
+def _glob_to_regex(pattern: str) -> Optional[str]:
+    """
+    Translate a glob to an (unanchored) regex in one left-to-right pass.
+
+    `*` matches any run of characters and `?` any single character;
+    everything else is matched literally. Returns None when the pattern has
+    no wildcards, so callers can use a plain substring check instead.
+    """
+    if '*' not in pattern and '?' not in pattern:
+        return None
+    return ''.join(_GLOB_WILDCARDS.get(c) or re.escape(c) for c in pattern)
+
+
+@lru_cache(maxsize=1024)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """
+    Convert a rule's glob pattern to a case-insensitive regex, once per pattern.
+
+    Rule globs are searched (unanchored), so leading/trailing `*` add
+    nothing; dropping them lets the regex start with a literal, which
+    CPython's engine scans for directly instead of trying every position.
+    """
+    core = pattern.strip('*')
+    return re.compile(_glob_to_regex(core) or re.escape(core), re.IGNORECASE)
+
+
+_GLOB_SPLIT_RE = re.compile(r'[*?]+')
+
+
+@lru_cache(maxsize=1024)
+def _glob_literal(pattern: str) -> Optional[str]:
+    """
+    The longest wildcard-free run of a glob, lowercased: a substring any
+    matching (ASCII) path must contain. None if there is no usable one.
+    """
+    literal = max(_GLOB_SPLIT_RE.split(pattern), key=len)
+    if not literal or not literal.isascii():
+        return None
+    return literal.lower()
+
+
+@lru_cache(maxsize=1024)
+def _normalized_extension(ext: str) -> str:
+    """A rule's extension as a lowercase '.ext', once per spelling."""
+    if not ext.startswith('.'):
+        ext = '.' + ext
+    return ext.lower()
+
+
+@lru_cache(maxsize=1024)
+def _lower_literal(text: str) -> str:
+    """A rule's substring pattern lowercased, once per pattern."""
+    return text.lower()
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex(regex: str, flags: int = 0) -> re.Pattern:
+    """Compile a rule's regex/entity_pattern once per (pattern, flags)."""
+    return re.compile(regex, flags)
+
+
+# Escapes that mean the same in RE2 and the stdlib engine on ASCII text
+_RE2_SAFE_ESCAPES = frozenset('dDwWb')
+
+_RE2_REPEAT_RE = re.compile(r'\{\d+(?:,\d*)?\}')
+
+
+def _re2_safe(pattern: str) -> bool:
+    r"""
+    Whether `pattern` is in the subset of regex syntax where RE2 and the
+    stdlib engine agree on ASCII text.
+
+    That rules out non-ASCII patterns, `$` (the stdlib also matches before
+    a trailing newline), `\s` (the stdlib also matches \x1c-\x1f),
+    letter escapes other than \d \D \w \W \b (\B differs on empty text),
+    `(?` groups other than `(?:`, POSIX classes, and `{` other than a
+    repeat count.
+    """
+    if not pattern.isascii():
+        return False
+
+    i = 0
+    n = len(pattern)
+    in_class = False
+    while i < n:
+        c = pattern[i]
+        if c == '\\':
+            escaped = pattern[i + 1:i + 2]
+            if escaped.isalnum() and (
+                escaped not in _RE2_SAFE_ESCAPES or (in_class and escaped == 'b')
+            ):
+                return False
+            i += 2
+            continue
+        if c == '[':
+            if pattern.startswith(':', i + 1):
+                return False
+            if not in_class:
+                in_class = True
+                # A leading ']' (after an optional '^') is a literal
+                i += 1
+                if pattern.startswith('^', i):
+                    i += 1
+                if pattern.startswith(']', i):
+                    i += 1
+                continue
+        elif in_class:
+            if c == ']':
+                in_class = False
+        elif c == '$':
+            return False
+        elif c == '(' and pattern.startswith('?', i + 1) and not pattern.startswith('?:', i + 1):
+            return False
+        elif c == '{' and not _RE2_REPEAT_RE.match(pattern, i):
+            return False
+        i += 1
+    return True
+
+
+class _Re2EntityPattern:
+    """
+    An entity_pattern that runs on RE2 for ASCII entities and on the stdlib
+    pattern for the rest, where the engines' Unicode handling differs.
+    """
+
+    __slots__ = ('_re2_search', '_std_search')
+
+    def __init__(self, re2_pattern, std_pattern: re.Pattern):
+        self._re2_search = re2_pattern.search
+        self._std_search = std_pattern.search
+
+    def search(self, text: str):
+        if text.isascii():
+            return self._re2_search(text)
+        return self._std_search(text)
+
+
+@lru_cache(maxsize=1024)
+def _compile_entity_pattern(pattern: str):
+    """
+    Compile a rule's entity_pattern case-insensitively, once per pattern.
+
+    When google-re2 is installed and the pattern is in the syntax subset
+    where both engines agree (see _re2_safe), ASCII entities are matched
+    with RE2, so matching is linear-time with no catastrophic
+    backtracking. Everything else keeps the stdlib engine, so installing
+    RE2 never changes which files a rule matches.
+    """
+    # Compiled with the stdlib first, so bad patterns fail as they always did
+    compiled = _compile_regex(pattern, re.IGNORECASE)
+    if re2 is None or not _re2_safe(pattern):
+        return compiled
+
+    options = re2.Options()
+    options.case_sensitive = False
+    options.log_errors = False
+    try:
+        return _Re2EntityPattern(re2.compile(pattern, options), compiled)
+    except re2.error:
+        return compiled
+
+
+def _required_literal(rule: Dict[str, Any]) -> Optional[str]:
+    """
+    Return a lowercase ASCII string that must occur in the lowercased path
+    for `rule` to match, or None if the rule has no such literal.
+    """
+    if 'pattern' not in rule or not isinstance(rule['pattern'], str):
+        return None
+
+    pattern = rule['pattern']
+    if '*' in pattern or '?' in pattern:
+        return _glob_literal(pattern)
+
+    if not pattern or not pattern.isascii():
+        return None
+    return pattern.lower()
+
+
+class _RulePrefilter:
+    """
+    Find the rules that can possibly match a file without trying them all.
+
+    Rule conditions split into file-context ones (extension, if_label,
+    entity, entity_pattern), which depend only on the file's suffix, label
+    and entities, and path ones (pattern, regex). The rules whose context
+    conditions pass are memoized per (suffix, label, entities) signature,
+    so files sharing a signature only run the path tests.
+
+    Among those, glob/substring rules each contribute a literal that the
+    path must contain; all such literals are matched together (one
+    Aho-Corasick pass when pyahocorasick is installed). Literal scanning
+    only applies to ASCII paths, since that is where lower() matches the
+    rule checks' case-insensitive matching exactly; other paths try every
+    literal rule.
+
+    Each rule's path conditions are also compiled once into a specialized
+    test (see _compile_path_test), so the per-file loop doesn't re-read
+    the rule dict.
+    """
+
+    # Signatures remembered before the memo is reset
+    MAX_CONTEXTS = 4096
+
+    def __init__(self, rule_list: List[Any]):
+        self.rule_list = rule_list
+        self.always: List[int] = []
+        self.by_ext: Dict[str, List[int]] = {}
+        by_literal: Dict[str, List[int]] = {}
+        for i, rule in enumerate(rule_list):
+            if not isinstance(rule, dict):
+                self.always.append(i)
+            elif isinstance(rule.get('extension'), str):
+                ext = _normalized_extension(rule['extension'])
+                self.by_ext.setdefault(ext, []).append(i)
+            else:
+                literal = _required_literal(rule)
+                if literal is None:
+                    self.always.append(i)
+                else:
+                    by_literal.setdefault(literal, []).append(i)
+
+        self.by_literal = by_literal
+        self.literal_rules: Set[int] = {
+            i for indices in by_literal.values() for i in indices
+        }
+        self.automaton = None
+        if ahocorasick is not None and by_literal:
+            self.automaton = ahocorasick.Automaton()
+            for literal in by_literal:
+                self.automaton.add_word(literal, literal)
+            self.automaton.make_automaton()
+
+        self.path_tests: List[PathTest] = [_compile_path_test(rule) for rule in rule_list]
+
+        self._contexts: Dict[Tuple[str, str, frozenset], Tuple[List[int], bool, Set[int]]] = {}
+
+    def for_context(
+            self,
+            suffix_lower: str,
+            current_label: str,
+            entities: List[str],
+    ) -> Tuple[List[int], bool, Set[int]]:
+        """
+        Indices (in rule order) of rules whose context conditions pass,
+        whether any of them is a literal rule worth a path scan, and the
+        rules whose context check raised (e.g. a malformed entity_pattern).
+
+        Those rules stay candidates and are re-checked only when reached,
+        so the error surfaces for the files it did before (no earlier
+        rule matched) and not for files an earlier rule routes.
+        """
+        key = (suffix_lower, current_label, frozenset(entities or ()))
+        cached = self._contexts.get(key)
+        if cached is not None:
+            return cached
+
+        if len(self._contexts) >= self.MAX_CONTEXTS:
+            self._contexts.clear()
+
+        indices = sorted(
+            self.always + self.by_ext.get(suffix_lower, []) + list(self.literal_rules)
+        )
+        passing: List[int] = []
+        deferred: Set[int] = set()
+        for i in indices:
+            try:
+                if not _context_matches(self.rule_list[i], suffix_lower, current_label, entities):
+                    continue
+            except Exception:
+                deferred.add(i)
+            passing.append(i)
+        cached = (passing, any(i in self.literal_rules for i in passing), deferred)
+        self._contexts[key] = cached
+        return cached
+
+    def literal_hits(self, path_str: str, path_lower: str) -> Optional[Set[int]]:
+        """Literal rules whose literal is in the path, or None to try them all."""
+        if not path_str.isascii():
+            return None
+
+        if self.automaton is not None:
+            found = {literal for _, literal in self.automaton.iter(path_lower)}
+        else:
+            found = {literal for literal in self.by_literal if literal in path_lower}
+
+        hits: Set[int] = set()
+        for literal in found:
+            hits.update(self.by_literal[literal])
+        return hits
+
+
+# (path_str, path_lower) -> whether a rule's pattern/regex conditions pass
+PathTest = Callable[[str, str], bool]
+
+
+def _always_true(path_str: str, path_lower: str) -> bool:
+    return True
+
+
+def _compile_path_test(rule: Any) -> PathTest:
+    """
+    Specialize _path_matches for one rule: the condition keys are read and
+    the glob/regex compiled here, once, leaving only the checks themselves.
+
+    Rules this can't specialize (non-dict rules, bad patterns) get the
+    generic _path_matches, so any error surfaces when and as it did before.
+    """
+    try:
+        checks: List[PathTest] = []
+
+        if 'pattern' in rule:
+            pattern = rule['pattern']
+            if '*' in pattern or '?' in pattern:
+                checks.append(_glob_test(pattern))
+            else:
+                literal = _lower_literal(pattern)
+                checks.append(lambda path_str, path_lower: literal in path_lower)
+
+        if 'regex' in rule:
+            regex_search = _compile_regex(rule['regex']).search
+            checks.append(lambda path_str, path_lower: regex_search(path_str) is not None)
+    except Exception:
+        return partial(_path_matches, rule)
+
+    if not checks:
+        return _always_true
+    if len(checks) == 1:
+        return checks[0]
+    first, second = checks
+    return lambda path_str, path_lower: first(path_str, path_lower) and second(path_str, path_lower)
+
+
+def _glob_test(pattern: str) -> PathTest:
+    """Glob check: literal reject (ASCII paths), then the regex."""
+    literal = _glob_literal(pattern)
+    glob_search = _compile_glob(pattern).search
+
+    if not literal:
+        return lambda path_str, path_lower: glob_search(path_str) is not None
+
+    def test(path_str: str, path_lower: str) -> bool:
+        if literal not in path_lower and path_str.isascii():
+            return False
+        return glob_search(path_str) is not None
+
+    return test
+
+
+# Rule fields the prefilter (buckets, context memo, path tests) is built from
+_MATCH_FIELDS = ('extension', 'pattern', 'regex', 'if_label', 'entity', 'entity_pattern')
+
+_MISSING = object()
+
+
+def _rules_key(rule_list: List[Any]) -> Tuple[Any, ...]:
+    """
+    Snapshot of what a prefilter is built from: each rule's id and match
+    fields. Compared on every lookup, so rules added, removed, replaced or
+    edited in place all rebuild the prefilter.
+    """
+    return tuple(
+        (id(rule), tuple([rule.get(field, _MISSING) for field in _MATCH_FIELDS]))
+        if isinstance(rule, dict) else (id(rule), rule)
+        for rule in rule_list
+    )
+
+
+# Last rule list a prefilter was built for, with its key (rules are applied
+# file by file with the same dict, so one slot is enough)
+_prefilter_cache: Tuple[Optional[List[Any]], Tuple[Any, ...], Optional[_RulePrefilter]] = (
+    None, (), None
+)
+
+
+def _get_prefilter(rule_list: List[Any]) -> _RulePrefilter:
+    """
+    The prefilter for rule_list's current contents. Building the key is
+    O(rules), so batches look the prefilter up once, not once per file.
+    """
+    global _prefilter_cache
+    cached_list, cached_key, prefilter = _prefilter_cache
+    key = _rules_key(rule_list)
+    if prefilter is None or cached_list is not rule_list or cached_key != key:
+        prefilter = _RulePrefilter(rule_list)
+        _prefilter_cache = (rule_list, key, prefilter)
+    return prefilter
+
 
 def load_rules(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """
@@ -33,25 +442,46 @@ def load_rules(config_path: Optional[Path] = None) -> Dict[str, Any]:
     if config_path is None:
         return {}
 
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except OSError:
         return {}
 
-    # V1: Just return empty dict
-    # Future: Parse YAML/JSON and return structured rules
+    # Parsed once per (path, mtime, size); callers get their own copy
+    rules = _load_rules_file(str(config_path), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(rules)
+
+
+@lru_cache(maxsize=32)
+def _load_rules_file(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a rules file; mtime_ns/size only key the cache."""
+    config_path = Path(path_str)
+
+    # JSON needs no YAML parser at all
+    if config_path.suffix.lower() == '.json':
+        return _load_rules_json(config_path)
+
     try:
         import yaml
-        with config_path.open('r', encoding='utf-8') as f:
-            rules = yaml.safe_load(f)
-            return rules if rules else {}
     except ImportError:
         # YAML not available, try JSON
-        try:
-            import json
-            with config_path.open('r', encoding='utf-8') as f:
-                rules = json.load(f)
-                return rules if rules else {}
-        except Exception:
-            return {}
+        return _load_rules_json(config_path)
+
+    # LibYAML's C loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        with config_path.open('r', encoding='utf-8') as f:
+            rules = yaml.load(f, Loader=loader)
+            return rules if rules else {}
+    except Exception:
+        return {}
+
+
+def _load_rules_json(config_path: Path) -> Dict[str, Any]:
+    try:
+        with config_path.open('r', encoding='utf-8') as f:
+            rules = json.load(f)
+            return rules if rules else {}
     except Exception:
         return {}
 
@@ -82,27 +512,157 @@ def apply_rules(
         # No rules to apply
         return current_label, None
 
-    path = result.path
+    rule = _first_matching_rule(result.path, current_label, entities, rules['rules'])
+    if rule is None:
+        # No rules matched
+        return current_label, None
+
+    # Apply the rule
+    new_label = rule.get('label', current_label)
+    new_action = rule.get('action')  # None if not specified
+
+    # Optionally log why rule was applied
+    if hasattr(result, 'why') and rule.get('reason'):
+        # Could modify result.why here if we want
+        pass
+
+    return new_label, new_action
+
+
+def _first_matching_rule(
+        path: Path,
+        current_label: str,
+        entities: List[str],
+        rule_list: List[Any],
+        prefilter: Optional[_RulePrefilter] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    The first rule in rule_list that matches the file, or None.
+
+    Pass `prefilter` (from _get_prefilter) when matching many files
+    against the same, unchanged rule list.
+    """
     path_str = str(path)
+    # Lowercased once per file, shared by every rule
+    path_lower = path_str.lower()
+    suffix_lower = path.suffix.lower()
+
+    # Rules whose suffix/label/entity conditions pass (memoized per signature)
+    if prefilter is None:
+        prefilter = _get_prefilter(rule_list)
+    candidates, scan_literals, deferred = prefilter.for_context(
+        suffix_lower, current_label, entities
+    )
+    if not candidates:
+        return None
+
+    # Skip literal rules whose required literal isn't in the path
+    hits = prefilter.literal_hits(path_str, path_lower) if scan_literals else None
+
+    # Apply rules in order (first match wins)
+    path_tests = prefilter.path_tests
+    for i in candidates:
+        if hits is not None and i in prefilter.literal_rules and i not in hits:
+            continue
+        if deferred and i in deferred and not _context_matches(
+            rule_list[i], suffix_lower, current_label, entities
+        ):
+            continue
+        if path_tests[i](path_str, path_lower):
+            return rule_list[i]
 
-    # Apply rules in order (first match wins, or use priority field)
-    rule_list = rules.get('rules', [])
+    return None
+
+
+# Below this many files, process-pool startup costs more than it saves
+_PARALLEL_MIN = 20000
 
-    for rule in rule_list:
-        if _rule_matches(rule, path, path_str, current_label, entities):
-            # Apply the rule
-            new_label = rule.get('label', current_label)
-            new_action = rule.get('action')  # None if not specified
+# Files per task sent to a worker process
+_BATCH_CHUNK = 1000
 
-            # Optionally log why rule was applied
-            if hasattr(result, 'why') and rule.get('reason'):
-                # Could modify result.why here if we want
-                pass
+# Rules config installed in each worker process by _init_rules_worker
+_worker_rules: Dict[str, Any] = {}
 
-            return new_label, new_action
 
-    # No rules matched
-    return current_label, None
+def _init_rules_worker(rules: Dict[str, Any]) -> None:
+    """Worker initializer: receive the rules once instead of with every chunk."""
+    global _worker_rules
+    _worker_rules = rules
+
+
+def _apply_rules_chunk(
+        chunk: List[Tuple[Path, str, List[str]]],
+) -> List[Tuple[str, Optional[str]]]:
+    """Worker entry point: apply the worker's rules to (path, label, entities) items."""
+    return _rule_outcomes(chunk, _worker_rules['rules'])
+
+
+def _rule_outcomes(
+        items: Iterable[Tuple[Path, str, List[str]]],
+        rule_list: List[Any],
+) -> List[Tuple[str, Optional[str]]]:
+    """apply_rules() outcomes for (path, label, entities) items, one prefilter lookup in all."""
+    prefilter = _get_prefilter(rule_list)
+    outcomes = []
+    for path, current_label, entities in items:
+        rule = _first_matching_rule(path, current_label, entities, rule_list, prefilter)
+        if rule is None:
+            outcomes.append((current_label, None))
+        else:
+            outcomes.append((rule.get('label', current_label), rule.get('action')))
+    return outcomes
+
+
+def apply_rules_batch(
+        results: Sequence[Any],
+        labels: Sequence[str],
+        actions: Sequence[Optional[str]],
+        entities_lists: Sequence[List[str]],
+        rules: Optional[Dict[str, Any]] = None,
+        workers: Optional[int] = None,
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    apply_rules() over many files at once.
+
+    Large batches are split into chunks of _BATCH_CHUNK files and run in a
+    process pool; rules are read-only, so each worker receives them once
+    (at startup) and builds its own prefilter. Small batches (or
+    workers=1) run in-process.
+
+    Args:
+        results: Analyzer Result objects (only .path is used)
+        labels: Current label for each result
+        actions: Current action for each result
+        entities_lists: Extracted entities for each result
+        rules: Rules dict from load_rules()
+        workers: Worker processes to use (defaults to os.cpu_count())
+
+    Returns:
+        (final_label, action_override) per result, in input order
+    """
+    if not rules or not rules.get('rules'):
+        return [(label, None) for label in labels]
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(results) < _PARALLEL_MIN:
+        return _rule_outcomes(
+            (
+                (result.path, label, entities)
+                for result, label, entities in zip(results, labels, entities_lists)
+            ),
+            rules['rules'],
+        )
+
+    items = [
+        (result.path, label, list(entities))
+        for result, label, entities in zip(results, labels, entities_lists)
+    ]
+    chunks = [items[i:i + _BATCH_CHUNK] for i in range(0, len(items), _BATCH_CHUNK)]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_rules_worker, initargs=(rules,)
+    ) as pool:
+        return list(chain.from_iterable(pool.map(_apply_rules_chunk, chunks)))
 
 
 def _rule_matches(
@@ -111,10 +671,16 @@ def _rule_matches(
         path_str: str,
         current_label: str,
         entities: List[str],
+        path_lower: Optional[str] = None,
+        suffix_lower: Optional[str] = None,
 ) -> bool:
     """
     Check if a rule matches the given file.
 
+    path_lower / suffix_lower are the lowercased path and suffix; callers
+    checking many rules against one file pass them in so they are only
+    computed once.
+
     Rules can specify multiple conditions:
     - pattern: glob or regex pattern for path
     - extension: file extension (e.g., ".kdbx")
@@ -122,35 +688,26 @@ def _rule_matches(
     - entity: only apply if specific entity is present
     - min_confidence: only apply if confidence >= threshold
     """
-    # Check extension match
-    if 'extension' in rule:
-        required_ext = rule['extension']
-        if not required_ext.startswith('.'):
-            required_ext = '.' + required_ext
-        if path.suffix.lower() != required_ext.lower():
-            return False
+    if suffix_lower is None:
+        suffix_lower = path.suffix.lower()
+    if path_lower is None:
+        path_lower = path_str.lower()
+    return (
+        _context_matches(rule, suffix_lower, current_label, entities)
+        and _path_matches(rule, path_str, path_lower)
+    )
 
-    # Check pattern match (glob-style)
-    if 'pattern' in rule:
-        pattern = rule['pattern']
-        # Convert glob to regex for matching
-        if '*' in pattern or '?' in pattern:
-            # Simple glob: convert to regex
-            regex_pattern = pattern.replace('/', r'\/')
-            regex_pattern = regex_pattern.replace('.', r'\.')
-            regex_pattern = regex_pattern.replace('*', '.*')
-            regex_pattern = regex_pattern.replace('?', '.')
-            if not re.search(regex_pattern, path_str, re.IGNORECASE):
-                return False
-        else:
-            # Exact substring match
-            if pattern.lower() not in path_str.lower():
-                return False
 
-    # Check regex match (more powerful than pattern)
-    if 'regex' in rule:
-        regex = rule['regex']
-        if not re.search(regex, path_str):
+def _context_matches(
+        rule: Dict[str, Any],
+        suffix_lower: str,
+        current_label: str,
+        entities: List[str],
+) -> bool:
+    """Check the conditions that don't depend on the full path."""
+    # Check extension match
+    if 'extension' in rule:
+        if suffix_lower != _normalized_extension(rule['extension']):
             return False
 
     # Check label match
@@ -165,11 +722,39 @@ def _rule_matches(
 
     # Check entity pattern (any entity matches pattern)
     if 'entity_pattern' in rule:
-        pattern = rule['entity_pattern']
-        if not any(re.search(pattern, entity, re.IGNORECASE) for entity in entities):
+        if not entities:
+            return False
+        compiled = _compile_entity_pattern(rule['entity_pattern'])
+        if not any(compiled.search(entity) for entity in entities):
+            return False
+
+    return True
+
+
+def _path_matches(rule: Dict[str, Any], path_str: str, path_lower: str) -> bool:
+    """Check the pattern/regex conditions against the path."""
+    # Check pattern match (glob-style)
+    if 'pattern' in rule:
+        pattern = rule['pattern']
+        # Convert glob to regex for matching
+        if '*' in pattern or '?' in pattern:
+            # Cheap substring reject first (exact for ASCII paths)
+            literal = _glob_literal(pattern)
+            if literal and literal not in path_lower and path_str.isascii():
+                return False
+            # Simple glob: converted to regex (cached per pattern)
+            if not _compile_glob(pattern).search(path_str):
+                return False
+        else:
+            # Exact substring match
+            if _lower_literal(pattern) not in path_lower:
+                return False
+
+    # Check regex match (more powerful than pattern)
+    if 'regex' in rule:
+        if not _compile_regex(rule['regex']).search(path_str):
             return False
 
-    # All conditions passed
     return True
 
 
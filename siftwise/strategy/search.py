@@ -5,13 +5,175 @@ Provides basic search capabilities over mapping data and file results.
 Foundation for future "Smart Search + Rule Capture" features.
 """
 
+from collections import defaultdict
+from functools import lru_cache, reduce
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+import operator
 import re
 
+import numpy as np
+import pandas as pd
+
+from .rules_engine import _glob_literal, _glob_to_regex
+
+
+class MappingTable:
+    """
+    Column-oriented view over mapping rows for vectorized searches.
+
+    Wraps the List[Dict[str, str]] rows and builds a pandas DataFrame on
+    first use, so string matching and filtering run over whole columns
+    instead of per-row dict lookups. Search functions accept either a
+    MappingTable or the plain rows; build one explicitly to reuse the
+    columns across several searches. Results are always the original row
+    dicts.
+
+    The residual flags and parsed confidences, which several searches
+    filter on, are kept as numpy arrays computed once per table.
+    """
+
+    def __init__(self, rows: List[Dict[str, str]]):
+        self.rows = rows
+        self._frame: Optional[pd.DataFrame] = None
+        self._lower: Dict[str, pd.Series] = {}
+        self._values: Dict[str, List[str]] = {}
+        self._entities: Optional[List[List[str]]] = None
+        self._is_residual: Optional[np.ndarray] = None
+        self._confidence: Optional[np.ndarray] = None
+        self._confidence_valid: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = pd.DataFrame(self.rows, dtype=object)
+        return self._frame
+
+    def column(self, field: str, default: str = '') -> pd.Series:
+        """Column values, with `default` wherever a row lacks the field."""
+        frame = self.frame
+        if field not in frame.columns:
+            return pd.Series(default, index=frame.index, dtype=object)
+        return frame[field].fillna(default)
+
+    def lower(self, field: str) -> pd.Series:
+        """Lowercased column (cached; missing values become '')."""
+        if field not in self._lower:
+            self._lower[field] = self.column(field).astype(str).str.lower()
+        return self._lower[field]
+
+    def values(self, field: str) -> List[str]:
+        """
+        Column as a plain list of strings (cached; missing values become '').
+
+        For matching that has to run per value in Python (e.g. compiled
+        regexes): indexing a list is far cheaper than row.get() per row.
+        """
+        if field not in self._values:
+            self._values[field] = self.column(field).astype(str).tolist()
+        return self._values[field]
+
+    def entity_lists(self) -> List[List[str]]:
+        """Each row's comma-separated Entities, split and stripped (cached)."""
+        if self._entities is None:
+            self._entities = [
+                [e for e in map(str.strip, (row.get('Entities') or '').split(',')) if e]
+                for row in self.rows
+            ]
+        return self._entities
+
+    @property
+    def is_residual(self) -> np.ndarray:
+        """Boolean array: IsResidual is 'true' (any case), per row."""
+        if self._is_residual is None:
+            self._is_residual = (self.lower('IsResidual') == 'true').to_numpy(dtype=bool)
+        return self._is_residual
+
+    @property
+    def confidence(self) -> np.ndarray:
+        """
+        Float array of float(row.get('Confidence', '0')) per row.
+
+        Values float() rejects (including None) are NaN here and False in
+        confidence_valid; a parsed 'nan' is NaN but still valid.
+        """
+        if self._confidence is None:
+            self._parse_confidence()
+        return self._confidence
+
+    @property
+    def confidence_valid(self) -> np.ndarray:
+        """Boolean array: the row's Confidence parsed as a float."""
+        if self._confidence_valid is None:
+            self._parse_confidence()
+        return self._confidence_valid
+
+    def _parse_confidence(self) -> None:
+        # float() per value, exactly as the row-based searches parsed it
+        # (pd.to_numeric would accept/reject different spellings)
+        confidence = np.full(len(self.rows), np.nan)
+        valid = np.zeros(len(self.rows), dtype=bool)
+        for i, row in enumerate(self.rows):
+            try:
+                confidence[i] = float(row.get('Confidence', '0'))
+            except (ValueError, TypeError):
+                continue
+            valid[i] = True
+        self._confidence = confidence
+        self._confidence_valid = valid
+
+    def positions(self, mask, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Indices where mask (Series or array) is True, in order, sliced
+        [:limit] like a list (so a negative limit drops from the end).
+        """
+        positions = np.flatnonzero(np.asarray(mask, dtype=bool))
+        if limit is not None:
+            positions = positions[:limit]
+        return positions
+
+    def take(self, mask, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """Rows where mask (Series or array) is True, in order, up to limit."""
+        return [self.rows[i] for i in self.positions(mask, limit)]
+
+
+MappingRows = Union[List[Dict[str, str]], MappingTable]
+
+
+def _as_table(mapping_rows: MappingRows) -> MappingTable:
+    if isinstance(mapping_rows, MappingTable):
+        return mapping_rows
+    return MappingTable(mapping_rows)
+
+
+@lru_cache(maxsize=1024)
+def _compile_search_pattern(pattern: str) -> Optional[re.Pattern]:
+    """
+    Compile a search_by_pattern pattern once.
+
+    Globs are converted to an anchored regex; anything else is used as a
+    regex as-is. Returns None if the result is not a valid regex.
+    """
+    # Determine if pattern is glob or regex
+    regex_pattern = _glob_to_regex(pattern)
+
+    if regex_pattern is not None:
+        regex_pattern = f'^{regex_pattern}$'
+    else:
+        # Use as-is (assume it's a regex)
+        regex_pattern = pattern
+
+    try:
+        return re.compile(regex_pattern, re.IGNORECASE)
+    except re.error:
+        return None
+
 
 def search_mapping(
-        mapping_rows: List[Dict[str, str]],
+        mapping_rows: MappingRows,
         query: str,
         limit: int = 100,
         fields: Optional[List[str]] = None,
@@ -22,7 +184,7 @@ def search_mapping(
     Searches across SourcePath, Label, Why, and other fields.
 
     Args:
-        mapping_rows: List of mapping row dicts from Mapping.csv
+        mapping_rows: Mapping row dicts from Mapping.csv (or a MappingTable)
         query: Search query (substring or simple pattern)
         limit: Maximum number of results to return
         fields: Optional list of fields to search in (default: all text fields)
@@ -33,33 +195,66 @@ def search_mapping(
     if not query or not query.strip():
         return []
 
+    table = _as_table(mapping_rows)
+    if not len(table):
+        return []
+
+    scope = np.ones(len(table), dtype=bool)
+    positions = _take_searched(table, scope, _query_mask(table, query, fields), limit)
+    return [table.rows[i] for i in positions]
+
+
+def _take_searched(
+        table: MappingTable,
+        scope,
+        matches,
+        limit: int,
+) -> List[int]:
+    """
+    Positions of rows in `scope` that are in `matches`, up to limit.
+
+    Follows the row-based search_mapping loop, which checks the limit
+    after every scanned row, matched or not: a limit <= 0 only ever
+    looks at the first row in scope.
+    """
+    scope = np.asarray(scope, dtype=bool)
+    matches = np.asarray(matches, dtype=bool)
+    if limit <= 0:
+        first = np.flatnonzero(scope)[:1]
+        return [int(i) for i in first if matches[i]]
+    return list(table.positions(scope & matches, limit))
+
+
+def _query_mask(
+        table: MappingTable,
+        query: str,
+        fields: Optional[List[str]] = None,
+        first_row: int = 0,
+) -> pd.Series:
+    """
+    Rows where the query is a case-insensitive substring of any field.
+
+    The default fields include Entities when the first searched row
+    (`first_row`) has it.
+    """
     query_lower = query.lower()
 
     # Default fields to search
     if fields is None:
         fields = ['SourcePath', 'Label', 'Why', 'Action']
         # Include Entities if present
-        if mapping_rows and 'Entities' in mapping_rows[0]:
+        if 'Entities' in table.rows[first_row]:
             fields.append('Entities')
 
-    matches = []
-
-    for row in mapping_rows:
-        # Check if query matches any field
-        for field in fields:
-            value = row.get(field, '')
-            if query_lower in value.lower():
-                matches.append(row)
-                break  # Don't add same row multiple times
-
-        if len(matches) >= limit:
-            break
-
-    return matches
+    # A row matches if the query is in any field (each row counted once)
+    return reduce(
+        operator.or_,
+        (table.lower(field).str.contains(query_lower, regex=False) for field in fields),
+    )
 
 
 def search_by_pattern(
-        mapping_rows: List[Dict[str, str]],
+        mapping_rows: MappingRows,
         pattern: str,
         field: str = 'SourcePath',
         limit: int = 100,
@@ -70,7 +265,7 @@ def search_by_pattern(
     More powerful than simple substring search.
 
     Args:
-        mapping_rows: List of mapping row dicts
+        mapping_rows: Mapping row dicts (or a MappingTable)
         pattern: Glob pattern (e.g., "*.pdf") or regex
         field: Field to search in (default: SourcePath)
         limit: Maximum results
@@ -78,31 +273,37 @@ def search_by_pattern(
     Returns:
         List of matching rows
     """
-    matches = []
-
-    # Determine if pattern is glob or regex
-    is_glob = any(c in pattern for c in ['*', '?'])
+    table = _as_table(mapping_rows)
+    return [table.rows[i] for i in _pattern_positions(table, pattern, field, limit)]
 
-    if is_glob:
-        # Convert glob to regex
-        regex_pattern = pattern.replace('.', r'\.')
-        regex_pattern = regex_pattern.replace('*', '.*')
-        regex_pattern = regex_pattern.replace('?', '.')
-        regex_pattern = f'^{regex_pattern}$'
-    else:
-        # Use as-is (assume it's a regex)
-        regex_pattern = pattern
 
-    try:
-        compiled = re.compile(regex_pattern, re.IGNORECASE)
-    except re.error:
+def _pattern_positions(
+        table: MappingTable,
+        pattern: str,
+        field: str = 'SourcePath',
+        limit: int = 100,
+) -> List[int]:
+    """Row indices for search_by_pattern, in order."""
+    compiled = _compile_search_pattern(pattern)
+    if compiled is None:
         # Invalid pattern, fall back to substring
-        return search_mapping(mapping_rows, pattern, limit, [field])
+        if not len(table) or not pattern.strip():
+            return []
+        scope = np.ones(len(table), dtype=bool)
+        return _take_searched(table, scope, _query_mask(table, pattern, [field]), limit)
+
+    # Globs: skip values missing the glob's longest literal without running
+    # the regex (exact for ASCII values, which lower() folds like IGNORECASE)
+    literal = _glob_literal(pattern) if _glob_to_regex(pattern) is not None else None
+    lowered = table.lower(field).tolist() if literal else None
 
-    for row in mapping_rows:
-        value = row.get(field, '')
-        if compiled.search(value):
-            matches.append(row)
+    matches = []
+    search = compiled.search
+    for i, value in enumerate(table.values(field)):
+        if literal and literal not in lowered[i] and value.isascii():
+            continue
+        if search(value):
+            matches.append(i)
 
             if len(matches) >= limit:
                 break
@@ -111,7 +312,7 @@ def search_by_pattern(
 
 
 def search_residuals(
-        mapping_rows: List[Dict[str, str]],
+        mapping_rows: MappingRows,
         query: Optional[str] = None,
         limit: int = 100,
 ) -> List[Dict[str, str]]:
@@ -128,21 +329,25 @@ def search_residuals(
     Returns:
         List of residual rows matching query (or all residuals if no query)
     """
-    # Filter to residuals first
-    residuals = [
-        row for row in mapping_rows
-        if row.get('IsResidual', '').lower() == 'true'
-    ]
+    table = _as_table(mapping_rows)
+    if not len(table):
+        return []
+    mask = table.is_residual
 
     if not query:
-        return residuals[:limit]
+        return table.take(mask, limit)
 
-    # Apply search query to residuals
-    return search_mapping(residuals, query, limit)
+    residual_positions = np.flatnonzero(mask)
+    if not query.strip() or not len(residual_positions):
+        return []
+    # Residual and query filters combined, then one take
+    query_mask = _query_mask(table, query, first_row=int(residual_positions[0]))
+    positions = _take_searched(table, mask, query_mask, limit)
+    return [table.rows[i] for i in positions]
 
 
 def search_by_confidence(
-        mapping_rows: List[Dict[str, str]],
+        mapping_rows: MappingRows,
         min_confidence: Optional[float] = None,
         max_confidence: Optional[float] = None,
         limit: int = 100,
@@ -161,30 +366,28 @@ def search_by_confidence(
     Returns:
         List of rows within confidence range
     """
-    matches = []
-
-    for row in mapping_rows:
-        try:
-            conf = float(row.get('Confidence', '0'))
-        except (ValueError, TypeError):
-            continue
-
-        if min_confidence is not None and conf < min_confidence:
-            continue
+    table = _as_table(mapping_rows)
+    if not len(table):
+        return []
 
-        if max_confidence is not None and conf > max_confidence:
-            continue
+    # Unparseable confidences are skipped; a parsed NaN fails no bound
+    # check (NaN < x and NaN > x are both False), so it is kept
+    conf = table.confidence
+    mask = table.confidence_valid.copy()
 
-        matches.append(row)
+    if min_confidence is not None:
+        mask &= ~(conf < min_confidence)
 
-        if len(matches) >= limit:
-            break
+    if max_confidence is not None:
+        mask &= ~(conf > max_confidence)
 
-    return matches
+    # The row-by-row version checked the limit only after adding a match,
+    # so a limit below 1 still returned the first match
+    return table.take(mask, max(limit, 1))
 
 
 def group_by_entity(
-        mapping_rows: List[Dict[str, str]],
+        mapping_rows: MappingRows,
 ) -> Dict[str, List[Dict[str, str]]]:
     """
     Group mapping rows by extracted entities.
@@ -192,31 +395,24 @@ def group_by_entity(
     Useful for discovering entity-based organization opportunities.
 
     Args:
-        mapping_rows: List of mapping row dicts with 'Entities' field
+        mapping_rows: Mapping rows (or a MappingTable) with 'Entities' field
 
     Returns:
         Dict mapping entity names to lists of rows containing that entity
     """
-    entity_groups: Dict[str, List[Dict[str, str]]] = {}
-
-    for row in mapping_rows:
-        entities_str = row.get('Entities', '')
-        if not entities_str:
-            continue
-
-        # Parse entities (assume comma-separated)
-        entities = [e.strip() for e in entities_str.split(',') if e.strip()]
+    table = _as_table(mapping_rows)
+    entity_groups: Dict[str, List[Dict[str, str]]] = defaultdict(list)
 
+    # Entities are split once per table (comma-separated)
+    for row, entities in zip(table.rows, table.entity_lists()):
         for entity in entities:
-            if entity not in entity_groups:
-                entity_groups[entity] = []
             entity_groups[entity].append(row)
 
-    return entity_groups
+    return dict(entity_groups)
 
 
 def search_and_suggest_rule(
-        mapping_rows: List[Dict[str, str]],
+        mapping_rows: MappingRows,
         pattern: str,
         target_label: str,
 ) -> Dict[str, Any]:
@@ -226,7 +422,7 @@ def search_and_suggest_rule(
     Foundation for "Smart Search + Rule Capture" feature.
 
     Args:
-        mapping_rows: List of mapping row dicts
+        mapping_rows: Mapping row dicts (or a MappingTable)
         pattern: Pattern to search for
         target_label: Proposed label for matching files
 
@@ -237,18 +433,17 @@ def search_and_suggest_rule(
         - impact: Stats about what the rule would affect
     """
     # Find matches
-    matches = search_by_pattern(mapping_rows, pattern)
+    table = _as_table(mapping_rows)
+    positions = _pattern_positions(table, pattern)
+    matches = [table.rows[i] for i in positions]
 
     # Analyze impact
     current_labels = {}
-    residual_count = 0
-
     for row in matches:
         label = row.get('Label', 'uncategorized')
         current_labels[label] = current_labels.get(label, 0) + 1
 
-        if row.get('IsResidual', '').lower() == 'true':
-            residual_count += 1
+    residual_count = int(table.is_residual[positions].sum()) if positions else 0
 
     # Suggest rule
     suggested_rule = {
@@ -269,46 +464,43 @@ def search_and_suggest_rule(
 
 
 def get_search_stats(
-        mapping_rows: List[Dict[str, str]],
+        mapping_rows: MappingRows,
 ) -> Dict[str, Any]:
     """
     Get statistics useful for search and analysis.
 
     Args:
-        mapping_rows: List of mapping row dicts
+        mapping_rows: List of mapping row dicts (or a MappingTable)
 
     Returns:
         Dict with various stats
     """
-    total = len(mapping_rows)
+    table = _as_table(mapping_rows)
+    total = len(table)
 
-    # Count by label
-    by_label = {}
-    # Count by action
-    by_action = {}
-    # Count residuals
+    by_label: Dict[str, int] = {}
+    by_action: Dict[str, int] = {}
     residual_count = 0
-    # Confidence distribution
-    confidences = []
+    avg_confidence = 0.0
 
-    for row in mapping_rows:
-        label = row.get('Label', 'uncategorized')
-        by_label[label] = by_label.get(label, 0) + 1
-
-        action = row.get('Action', 'Skip')
-        by_action[action] = by_action.get(action, 0) + 1
-
-        if row.get('IsResidual', '').lower() == 'true':
-            residual_count += 1
+    if total:
+        # Count by label / action (first-seen order, like a running dict)
+        by_label = {
+            k: int(v) for k, v in table.column('Label', 'uncategorized').value_counts(sort=False).items()
+        }
+        by_action = {
+            k: int(v) for k, v in table.column('Action', 'Skip').value_counts(sort=False).items()
+        }
 
-        try:
-            conf = float(row.get('Confidence', '0'))
-            confidences.append(conf)
-        except (ValueError, TypeError):
-            pass
+        # Count residuals
+        residual_count = int(table.is_residual.sum())
 
-    # Calculate confidence stats
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        # Mean over the confidences that parsed (a parsed NaN makes it NaN),
+        # summed left to right like the original running sum
+        valid = table.confidence_valid
+        conf_count = int(valid.sum())
+        if conf_count:
+            avg_confidence = sum(table.confidence[valid].tolist()) / conf_count
 
     return {
         'total_files': total,
@@ -1,10 +1,23 @@
-import pandas as pd
+import csv
+import os
 
-csv = r"C:\Users\leopa\Desktop\ArchiveTest\Sorted\.sift\Mapping.csv"
+csv_path = r"C:\Users\leopa\Desktop\ArchiveTest\Sorted\.sift\Mapping.csv"
+tmp_path = csv_path + ".tmp"
 
-df = pd.read_csv(csv)
+# Stream row by row into a temp file, then swap it in
+with open(csv_path, "r", newline="", encoding="utf-8", buffering=1 << 20) as src, \
+        open(tmp_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as dst:
+    reader = csv.reader(src)
+    writer = csv.writer(dst)
 
-df.loc[df["Action"] == "Suggest", "Action"] = "Move"
+    header = next(reader)
+    writer.writerow(header)
+    action_idx = header.index("Action")
 
-df.to_csv(csv, index=False)
+    for row in reader:
+        if len(row) > action_idx and row[action_idx] == "Suggest":
+            row[action_idx] = "Move"
+        writer.writerow(row)
+
+os.replace(tmp_path, csv_path)
 print("Updated Suggest → Move in Mapping.csv")
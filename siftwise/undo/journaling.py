@@ -0,0 +1,87 @@
+"""
+Event journal reader for undo.
+
+Each line of .sift/journal.jsonl is one JSON event
+({"run_id", "event", "src", "final_dst", ...}), appended in run order.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson  # optional accelerator (pip install orjson)
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Bytes read per step when scanning the journal backwards
+_REVERSE_BLOCK_SIZE = 64 * 1024
+
+
+def get_journal_path(sift_dir: Path) -> Path:
+    """journal.jsonl inside the .sift directory."""
+    return sift_dir / "journal.jsonl"
+
+
+def _parse_event(line: bytes) -> Optional[Dict[str, Any]]:
+    """One journal line as a dict; None for blank or unreadable lines."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        event = _json_loads(line)
+    except ValueError:
+        return None  # e.g. a line torn by an interrupted write
+    return event if isinstance(event, dict) else None
+
+
+def iter_events(sift_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Journal events oldest first, parsed one line at a time."""
+    path = get_journal_path(sift_dir)
+    if not path.exists():
+        return
+
+    with path.open("rb") as f:
+        for line in f:
+            event = _parse_event(line.lstrip(b"\xef\xbb\xbf"))
+            if event is not None:
+                yield event
+
+
+def read_events(sift_dir: Path) -> List[Dict[str, Any]]:
+    """All journal events, oldest first (empty if there is no journal)."""
+    return list(iter_events(sift_dir))
+
+
+def iter_events_reverse(sift_dir: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Journal events newest first, reading the file backwards in blocks.
+
+    Callers that only need the tail of the journal (e.g. the last run)
+    can stop early without reading the rest of the file.
+    """
+    path = get_journal_path(sift_dir)
+    if not path.exists():
+        return
+
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b""  # Start of the line that continues into the next block
+        while pos > 0:
+            step = min(_REVERSE_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b"\n")
+            partial = lines[0]
+            for line in reversed(lines[1:]):
+                event = _parse_event(line)
+                if event is not None:
+                    yield event
+
+        event = _parse_event(partial.lstrip(b"\xef\xbb\xbf"))
+        if event is not None:
+            yield event
@@ -1,74 +1,170 @@
 ﻿from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Set, Tuple
 from datetime import datetime
-import shutil
+from itertools import takewhile
+import os
 
-from .journaling import read_events, get_journal_path
-from .executor import _resolve_collision  # we added this in core closeout
+import pandas as pd
+
+from .journaling import iter_events_reverse, get_journal_path
+from siftwise.execute.executor import (
+    DirListings,
+    _dedupe_target,
+    _do_op,
+    _folder_devices,
+    _make_parent_dirs,
+    _path_exists,
+)
+
+
+def _restore_target(src: str, reserved: Set[str]) -> Tuple[str, int]:
+    """
+    Dedupe `src` against the disk as it is now (os.path.lexists, so broken
+    symlinks count too) and against `reserved` restore paths still to come.
+    """
+    taken = set(reserved)
+    while True:
+        candidate, dup_index = _dedupe_target(src, taken)
+        if not os.path.lexists(candidate):
+            return candidate, dup_index
+        taken.add(candidate)
 
 
 def undo_last_run(dest_root: Path, sift_dir: Path, what_if: bool = False) -> Dict[str, Any]:
     """
     Undo ONLY the most recent run in journal.jsonl.
     Strategy:
-      1) read all events
-      2) find last run_id
-      3) reverse events for that run in reverse order
+      1) read the journal backwards
+      2) the newest event gives the last run_id
+      3) reverse that run's events, newest first, stopping at the
+         previous run (older runs are never read)
+
+    Moves are restored with a rename when source and destination folders
+    share a filesystem; shutil.move() is only used across devices.
     """
-    events = read_events(sift_dir)
-    if not events:
+    events = iter_events_reverse(sift_dir)
+    newest = next(events, None)
+    if newest is None:
         print("[undo] No journal found. Nothing to undo.")
         return {"undone": 0, "skipped": 0, "run_id": None}
 
-    last_run_id = events[-1].get("run_id")
-    last_run_events = [e for e in events if e.get("run_id") == last_run_id]
+    # Newest first, up to the first event of an earlier run
+    last_run_id = newest.get("run_id")
+    last_run_events = [newest]
+    last_run_events.extend(takewhile(lambda e: e.get("run_id") == last_run_id, events))
+
+    # CollisionRename and other informational events have no undo operation
+    frame = pd.DataFrame.from_records(last_run_events, columns=["event", "src", "final_dst"])
+    frame = frame[frame["event"].isin(("Move", "Copy"))]
 
     undone = 0
     skipped = 0
 
     print(f"[undo] Undoing run_id={last_run_id} ({len(last_run_events)} events)")
 
-    for e in reversed(last_run_events):
-        ev_type = e.get("event")
-        src = Path(e["src"])
-        final_dst = Path(e["final_dst"])
+    # Plan every reversal first: existence checks share one directory
+    # listing per folder taken before anything moves. The planned
+    # reversals are replayed on top of it in order: restored names are
+    # claimed (so two events never restore onto the same path) and paths
+    # moved away or deleted are freed (so a later reversal can restore
+    # onto a path an earlier one vacates, as a sequential replay would).
+    listings: DirListings = {}
+    claimed: Set[str] = set()
+    freed: Set[str] = set()
+    ops: List[Tuple[str, str, str, str]] = []  # (final_dst, back_dst, event, src)
+
+    def planned_exists(path: str) -> bool:
+        if path in claimed:
+            return True
+        return path not in freed and _path_exists(path, listings)
+
+    def vacate(path: str) -> None:
+        claimed.discard(path)
+        freed.add(path)
+
+    for ev_type, src, final_dst in frame.itertuples(index=False, name=None):
+        src = str(src)
+        final_dst = str(final_dst)
 
         # For a Move: reverse by moving final_dst back to src
         if ev_type == "Move":
-            if not final_dst.exists():
+            if not planned_exists(final_dst):
                 print(f"[undo-skip] missing moved file: {final_dst}")
                 skipped += 1
                 continue
 
-            back_dst, dup_index = _resolve_collision(src)
+            vacate(final_dst)
+            back_dst, dup_index = _dedupe_target(src, claimed, listings, freed)
+            freed.discard(back_dst)
+            claimed.add(back_dst)
             if dup_index > 0:
-                print(f"[undo-collision] source exists, restoring as {back_dst.name}")
+                print(f"[undo-collision] source exists, restoring as {os.path.basename(back_dst)}")
 
             if what_if:
                 print(f"DRY: UNDO Move {final_dst} -> {back_dst}")
-            else:
-                back_dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.move(str(final_dst), str(back_dst))
-            undone += 1
+            ops.append((final_dst, back_dst, ev_type, src))
 
         # For a Copy: undo by deleting the copy (safe delete)
-        elif ev_type == "Copy":
-            if not final_dst.exists():
+        else:
+            if not planned_exists(final_dst):
                 print(f"[undo-skip] missing copied file: {final_dst}")
                 skipped += 1
                 continue
 
+            vacate(final_dst)
+
             if what_if:
                 print(f"DRY: UNDO Copy (delete) {final_dst}")
+            ops.append((final_dst, "", ev_type, src))
+
+    if what_if:
+        undone = len(ops)
+    else:
+        # Each restore folder is created once, and moves within one
+        # filesystem are a bare rename
+        restores = [back_dst for _, back_dst, ev_type, _ in ops if ev_type == "Move"]
+        dir_errors = _make_parent_dirs(restores)
+        devices = _folder_devices(
+            restores + [final_dst for final_dst, _, ev_type, _ in ops if ev_type == "Move"]
+        )
+
+        # The plan assumed every earlier reversal succeeds. Restore paths
+        # are checked again just before each move, so a path that a failed
+        # reversal did not free is never overwritten.
+        pending = set(restores)
+
+        for final_dst, back_dst, ev_type, src in ops:
+            if ev_type == "Copy":
+                try:
+                    os.unlink(final_dst)
+                    error = None
+                except OSError as e:
+                    error = str(e)
             else:
-                final_dst.unlink()
-            undone += 1
-
-        # CollisionRename is informational; no direct undo op needed
-        else:
-            continue
+                pending.discard(back_dst)
+                if os.path.lexists(back_dst):
+                    back_dst, _ = _restore_target(src, pending)
+                    print(
+                        "[undo-collision] source still exists, "
+                        f"restoring as {os.path.basename(back_dst)}"
+                    )
+
+                parent = os.path.dirname(back_dst)
+                error = dir_errors.get(parent)
+                if error is None:
+                    device = devices.get(parent)
+                    same_device = device is not None and device == devices.get(
+                        os.path.dirname(final_dst)
+                    )
+                    _, _, _, error = _do_op((final_dst, back_dst, "Move"), same_device)
+
+            if error is None:
+                undone += 1
+            else:
+                print(f"[undo-error] {ev_type} {final_dst}: {error}")
+                skipped += 1
 
     summary = {
         "run_id": last_run_id,
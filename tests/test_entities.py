@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import pytest
+
+from siftwise.analyze import entities
+from siftwise.analyze.entities import (
+    PLACE_ENTITIES,
+    extract_entities_for_result,
+    find_entities,
+    match_entity_in_token,
+)
+
+
+@pytest.fixture(params=["automaton", "python"])
+def scanner(request, monkeypatch):
+    """Run a test against the Aho-Corasick scan and the pure-Python fallback."""
+    if request.param == "automaton":
+        if entities._ENTITY_AUTOMATON is None:
+            pytest.skip("pyahocorasick not installed")
+    else:
+        monkeypatch.setattr(entities, "_ENTITY_AUTOMATON", None)
+    return request.param
+
+
+def test_match_entity_in_token_accepts_plain_sets():
+    entity_set = {"chase", "wells fargo"}
+
+    assert match_entity_in_token("Chase", entity_set) == "chase"
+    assert match_entity_in_token("my_wells-fargo statement", entity_set) == "wells fargo"
+    assert match_entity_in_token("Trip_New-York-City", PLACE_ENTITIES) == "new york city"
+    assert match_entity_in_token("unrelated", entity_set) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    # Multi-word entities match across words, longest first at a position
+    ("new york city trip", [
+        ("new york city", "place"), ("new york", "place"), ("trip", "place"),
+    ]),
+    ("of new york", [("new york", "place")]),
+    ("bank of america", [("bank of america", "org")]),
+    # Hits come back in path order
+    ("nyc leo wells fargo", [
+        ("nyc", "place"), ("leo", "person"), ("wells fargo", "org"),
+    ]),
+    # Only whole words count
+    ("atlanta", [("atlanta", "place")]),
+    ("xnyc nycx", []),
+    ("fargo", []),
+    ("wellsfargo", []),
+    ("", []),
+])
+def test_find_entities(scanner, text, expected):
+    assert find_entities(text) == expected
+
+
+def test_find_entities_breaks_ties_by_dictionary_order(scanner, monkeypatch):
+    kinds = (
+        ("org", frozenset({"jordan"})),
+        ("person", frozenset({"jordan", "jordan lee"})),
+        ("place", frozenset({"jordan"})),
+    )
+    monkeypatch.setattr(entities, "_ENTITY_KINDS", kinds)
+    single, phrases = entities._build_word_indexes()
+    monkeypatch.setattr(entities, "_SINGLE_INDEX", single)
+    monkeypatch.setattr(entities, "_PHRASE_INDEX", phrases)
+    if scanner == "automaton":
+        monkeypatch.setattr(entities, "_ENTITY_AUTOMATON", entities._build_entity_automaton())
+
+    # Same start: longer entity first, then org -> person -> place
+    assert find_entities("jordan lee") == [
+        ("jordan lee", "person"), ("jordan", "org"), ("jordan", "person"), ("jordan", "place"),
+    ]
+
+
+@pytest.mark.parametrize("path, expected", [
+    # Parent folder beats the filename, whatever the kinds
+    ("/root/Farah/amazon_receipt.pdf", ("Farah", "person", "parent")),
+    ("/root/nyc/amazon.pdf", ("Nyc", "place", "parent")),
+    ("/root/Chase_2023/stuff.pdf", ("Chase", "org", "parent")),
+    # Within one component: org > person > place, regardless of position
+    ("/root/leo_amazon_fargo/2023.pdf", ("Amazon", "org", "parent")),
+    ("/root/orlando_farah/x.pdf", ("Farah", "person", "parent")),
+    ("/root/fargo_of/nyc-leo-wells-fargo.pdf", ("WellsFargo", "org", "filename")),
+    ("/root/Trips/nyc_leo.pdf", ("Leo", "person", "filename")),
+    ("/root/misc/farah_orlando.pdf", ("Farah", "person", "filename")),
+    # Filename is used when the parent has no entity
+    ("/root/of/new-york.pdf", ("NewYork", "place", "filename")),
+    ("/root/x/new-york-city-trip.pdf", ("NewYorkCity", "place", "filename")),
+    ("/root/x/bank-of-america_2023.pdf", ("BankOfAmerica", "org", "filename")),
+    ("/root/x/copy.pdf", ("", "none", "none")),
+])
+def test_extract_entities_precedence(scanner, path, expected):
+    result = extract_entities_for_result(Path(path))
+
+    assert (result.entity, result.kind, result.source) == expected
@@ -0,0 +1,168 @@
+import errno
+import json
+import os
+from pathlib import Path
+
+from siftwise.execute import executor
+from siftwise.execute.executor import (
+    _cached_node_paths,
+    _dedupe_target,
+    _do_op,
+    _path_exists,
+    execute_from_plan,
+)
+
+PLAN = {"nodes": []}
+
+
+def test_rows_without_target_are_reported_without_verbose(tmp_path, capsys):
+    src = tmp_path / "in" / "a.txt"
+    src.parent.mkdir()
+    src.write_text("a")
+    rows = [{"SourcePath": str(src), "TargetPath": "", "Action": "Move"}]
+
+    for what_if in (True, False):
+        execute_from_plan(PLAN, rows, tmp_path / "out", what_if=what_if)
+
+        out = capsys.readouterr().out
+        assert f"[skip] No TargetPath in mapping for: {src}" in out
+        assert "of which no TargetPath: 1" in out
+    assert src.exists()
+
+
+def _write_file(path, text="x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_collision_is_renamed_and_journaled(tmp_path):
+    src = _write_file(tmp_path / "in" / "a.txt", "new")
+    _write_file(tmp_path / "out" / "Docs" / "a.txt", "old")
+    rows = [{"SourcePath": str(src), "TargetPath": "Docs/a.txt", "Action": "Move"}]
+
+    execute_from_plan(PLAN, rows, tmp_path / "out")
+
+    assert (tmp_path / "out" / "Docs" / "a.txt").read_text() == "old"
+    assert (tmp_path / "out" / "Docs" / "a__dup1.txt").read_text() == "new"
+    journal = (tmp_path / "out" / ".sift" / "journal.log").read_text(encoding="utf-8")
+    assert "dup_index=1" in journal
+
+
+def test_two_rows_with_one_target_never_overwrite(tmp_path):
+    a = _write_file(tmp_path / "in" / "1" / "a.txt", "one")
+    b = _write_file(tmp_path / "in" / "2" / "a.txt", "two")
+    rows = [
+        {"SourcePath": str(a), "TargetPath": "Docs/a.txt", "Action": "Move"},
+        {"SourcePath": str(b), "TargetPath": "Docs/a.txt", "Action": "Copy"},
+    ]
+
+    execute_from_plan(PLAN, rows, tmp_path / "out")
+
+    assert (tmp_path / "out" / "Docs" / "a.txt").read_text() == "one"
+    assert (tmp_path / "out" / "Docs" / "a__dup1.txt").read_text() == "two"
+
+
+def test_dedupe_target_on_case_insensitive_filesystem(tmp_path, monkeypatch):
+    _write_file(tmp_path / "Docs" / "Report.PDF")
+    listings = {}
+    target = str(tmp_path / "Docs" / "report.pdf")
+
+    # Case-sensitive filesystem: a different case is a different file
+    assert _dedupe_target(target, set(), listings) == (target, 0)
+
+    # Case-insensitive filesystem: the listing's casefold match is
+    # confirmed with os.path.exists(), which now reports it as taken
+    def exists_ci(path):
+        parent, name = os.path.split(path)
+        return os.path.isdir(parent) and name.casefold() in {
+            n.casefold() for n in os.listdir(parent)
+        }
+
+    monkeypatch.setattr(executor.os.path, "exists", exists_ci)
+    assert _dedupe_target(target, set(), {}) == (
+        str(tmp_path / "Docs" / "report__dup1.pdf"), 1
+    )
+
+
+def test_path_exists_uses_listing_for_exact_names(tmp_path, monkeypatch):
+    path = _write_file(tmp_path / "Docs" / "a.txt")
+    listings = {}
+
+    def no_stat(p):
+        raise AssertionError("exact name should come from the listing")
+
+    monkeypatch.setattr(executor.os.path, "exists", no_stat)
+    assert _path_exists(str(path), listings)
+    assert not _path_exists(str(tmp_path / "Docs" / "b.txt"), listings)
+    assert not _path_exists(str(tmp_path / "Missing" / "a.txt"), listings)
+
+
+def test_same_device_move_falls_back_on_cross_device_error(tmp_path, monkeypatch):
+    src = _write_file(tmp_path / "a.txt", "data")
+    dst = tmp_path / "out" / "a.txt"
+    dst.parent.mkdir()
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(executor.os, "rename", cross_device)
+    monkeypatch.setattr(executor.shutil, "move", lambda s, d: os.replace(s, d))
+
+    assert _do_op((str(src), str(dst), "Move"), same_device=True)[3] is None
+    assert dst.read_text() == "data"
+    assert not src.exists()
+
+
+def test_same_device_move_reports_other_rename_errors(tmp_path, monkeypatch):
+    src = _write_file(tmp_path / "a.txt")
+
+    def denied(src, dst):
+        raise PermissionError(errno.EACCES, "Permission denied")
+
+    monkeypatch.setattr(executor.os, "rename", denied)
+    monkeypatch.setattr(executor.shutil, "move", None)  # Must not be reached
+
+    error = _do_op((str(src), str(tmp_path / "b.txt"), "Move"), same_device=True)[3]
+    assert "Permission denied" in error
+    assert src.exists()
+
+
+def _tree_plan(*names):
+    return {
+        "root_id": "n_root",
+        "nodes": [{"id": "n_root", "name": "Sorted", "parent": None}]
+        + [{"id": f"n_{name}", "name": name, "parent": "n_root"} for name in names],
+    }
+
+
+def test_node_path_cache_is_reused_until_treeplan_changes(tmp_path, monkeypatch):
+    plan_path = tmp_path / "TreePlan.json"
+    cache_path = tmp_path / "index.pickle"
+    plan = _tree_plan("Docs")
+    plan_path.write_text(json.dumps(plan))
+
+    assert _cached_node_paths(plan, plan_path, cache_path)["n_Docs"] == Path("Docs")
+
+    # Unchanged TreePlan.json: served from the cache without re-indexing
+    monkeypatch.setattr(executor, "_build_node_paths", None)
+    assert _cached_node_paths(plan, plan_path, cache_path)["n_Docs"] == Path("Docs")
+    monkeypatch.undo()
+
+    # Edited TreePlan.json: the stale index is rebuilt
+    plan = _tree_plan("Docs", "Photos")
+    plan_path.write_text(json.dumps(plan))
+    st = plan_path.stat()
+    os.utime(plan_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert _cached_node_paths(plan, plan_path, cache_path)["n_Photos"] == Path("Photos")
+
+
+def test_node_path_cache_survives_a_corrupt_cache_file(tmp_path):
+    plan_path = tmp_path / "TreePlan.json"
+    cache_path = tmp_path / "index.pickle"
+    plan = _tree_plan("Docs")
+    plan_path.write_text(json.dumps(plan))
+    cache_path.write_bytes(b"not a pickle")
+
+    assert _cached_node_paths(plan, plan_path, cache_path)["n_Docs"] == Path("Docs")
+    assert _cached_node_paths(plan, plan_path, cache_path)["n_Docs"] == Path("Docs")
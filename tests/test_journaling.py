@@ -0,0 +1,65 @@
+import csv
+import time
+
+import pytest
+
+from siftwise.execute.journaling import Journal
+
+
+def _rows(path):
+    with path.open(newline="", encoding="utf-8") as f:
+        return [(row["Operation"], row["SourcePath"]) for row in csv.DictReader(f)]
+
+
+def test_moves_are_on_disk_without_flush(tmp_path):
+    journal = Journal(tmp_path / "journal.log")
+
+    journal.log_skip("/in/s1", "Action=Skip")
+    journal.log_move("/in/a", "/out/a")
+    journal.log_copy("/in/b", "/out/b")
+    journal.log_skip("/in/s2", "Action=Skip")
+
+    # As if the process died here: buffered skips after the last
+    # operation may be lost, but every operation (and what preceded it) is there
+    assert _rows(tmp_path / "journal.log") == [
+        ("Skip", "/in/s1"), ("Move", "/in/a"), ("Copy", "/in/b"),
+    ]
+
+    journal.flush()
+    assert _rows(tmp_path / "journal.log")[-1] == ("Skip", "/in/s2")
+
+
+def test_rows_keep_their_order_across_writer_batches(tmp_path):
+    journal = Journal(tmp_path / "journal.log")
+    journal.FLUSH_EVERY = 3
+
+    expected = []
+    for i in range(10):
+        journal.log_skip(f"/in/s{i}", "Residual - left in place")
+        expected.append(("Skip", f"/in/s{i}"))
+        if i % 4 == 0:
+            journal.log_move(f"/in/m{i}", f"/out/m{i}")
+            expected.append(("Move", f"/in/m{i}"))
+    journal.sync()
+    journal.log_skip("/in/last", "Action=Skip")
+    journal.flush()
+
+    assert _rows(tmp_path / "journal.log") == expected + [("Skip", "/in/last")]
+
+
+def test_log_raises_once_the_writer_thread_fails(tmp_path):
+    path = tmp_path / "journal.log"
+    journal = Journal(path)
+    journal.FLUSH_EVERY = 1
+    # The writer thread can no longer append to the journal
+    path.unlink()
+    path.mkdir()
+
+    with pytest.raises(OSError):
+        for i in range(500):
+            journal.log_skip(f"/in/s{i}", "Action=Skip")
+            time.sleep(0.01)
+    assert i < 499
+
+    with pytest.raises(OSError):
+        journal.flush()
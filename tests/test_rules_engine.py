@@ -0,0 +1,103 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from siftwise.strategy import rules_engine
+from siftwise.strategy.rules_engine import (
+    _compile_entity_pattern,
+    _re2_safe,
+    apply_rules,
+    apply_rules_batch,
+)
+
+
+class _Result:
+    def __init__(self, path):
+        self.path = Path(path)
+
+
+ENTITY_PATTERNS = [
+    r"\d+", r"^acme", r"acme$", r"\bacme\b", r"\Bcme", r"ac.e", r"[a-c]+corp",
+    r"(?:acme|globex)", r"(?=acme)", r"\s", r"\w+_\w+", r"[[:alpha:]]+", r"a{,2}",
+    r"k", r"^$",
+]
+
+ENTITIES = [
+    "", "acme", "ACME", "Acme Corp", "acme\n", "globex_2024", "٣", "123", "café",
+    "\x1c", "K", "K", "ac_e", "bcorp",
+]
+
+
+@pytest.mark.filterwarnings("ignore:Possible nested set:FutureWarning")
+@pytest.mark.parametrize("pattern", ENTITY_PATTERNS)
+def test_entity_pattern_matches_like_stdlib_re(pattern):
+    compiled = _compile_entity_pattern(pattern)
+    std = re.compile(pattern, re.IGNORECASE)
+
+    for entity in ENTITIES:
+        assert bool(compiled.search(entity)) == bool(std.search(entity)), entity
+
+
+@pytest.mark.parametrize("pattern, safe", [
+    (r"\d+", True),
+    (r"\bacme\b", True),
+    (r"(?:acme|globex){1,3}", True),
+    (r"[]$]x", True),
+    (r"acme$", False),
+    (r"\s", False),
+    (r"\B", False),
+    (r"(?=acme)", False),
+    (r"(?i)acme", False),
+    (r"[[:alpha:]]", False),
+    (r"a{,2}", False),
+    (r"[\b]", False),
+    ("café", False),
+])
+def test_re2_safe_subset(pattern, safe):
+    assert _re2_safe(pattern) is safe
+
+
+@pytest.mark.skipif(rules_engine.re2 is None, reason="google-re2 not installed")
+def test_re2_is_used_only_for_safe_patterns():
+    assert isinstance(_compile_entity_pattern(r"\d+"), rules_engine._Re2EntityPattern)
+    assert isinstance(_compile_entity_pattern(r"acme$"), re.Pattern)
+
+
+def test_unicode_digit_entity_routes_as_with_stdlib():
+    rules = {"rules": [{"entity_pattern": r"\d+", "label": "numbered"}]}
+
+    assert apply_rules(_Result("/in/a.pdf"), "docs", None, ["٣"], rules) == ("numbered", None)
+
+
+def test_rules_edited_in_place_are_picked_up():
+    result = _Result("/in/ADP/a.pdf")
+    rules = {"rules": [{"pattern": "*/ADP/*", "label": "payroll"}]}
+    assert apply_rules(result, "docs", None, [], rules) == ("payroll", None)
+
+    rules["rules"][0]["pattern"] = "*/IRS/*"
+    assert apply_rules(result, "docs", None, [], rules) == ("docs", None)
+
+    rules["rules"][0]["pattern"] = "*/ADP/*"
+    rules["rules"][0]["if_label"] = "taxes"
+    assert apply_rules_batch([result], ["docs"], [None], [[]], rules) == [("docs", None)]
+
+    rules["rules"].append({"extension": "pdf", "action": "Skip"})
+    assert apply_rules(result, "docs", None, [], rules) == ("docs", "Skip")
+
+
+def test_malformed_entity_pattern_only_raises_when_reached():
+    rules = {"rules": [
+        {"pattern": "*/ADP/*", "label": "payroll"},
+        {"entity_pattern": "(unclosed", "label": "broken"},
+    ]}
+
+    # An earlier rule routes the file, so the bad rule is never evaluated
+    assert apply_rules(_Result("/in/ADP/a.pdf"), "docs", None, ["acme"], rules) == ("payroll", None)
+
+    with pytest.raises(re.error):
+        apply_rules(_Result("/in/other/a.pdf"), "docs", None, ["acme"], rules)
+    # Same context again (memoized): still raises when reached
+    with pytest.raises(re.error):
+        apply_rules(_Result("/in/more/b.pdf"), "docs", None, ["acme"], rules)
+    assert apply_rules(_Result("/in/ADP/b.pdf"), "docs", None, ["acme"], rules) == ("payroll", None)
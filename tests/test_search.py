@@ -0,0 +1,303 @@
+import math
+import re
+
+import pytest
+
+from siftwise.strategy import search
+from siftwise.strategy.search import MappingTable
+
+
+# Row-based reference versions of the searches, as they were before the
+# column-oriented MappingTable: the vectorized ones must return the same
+# rows (the same dicts, in the same order).
+
+def _ref_search_mapping(rows, query, limit=100, fields=None):
+    if not query or not query.strip():
+        return []
+    if fields is None:
+        fields = ['SourcePath', 'Label', 'Why', 'Action']
+        if rows and 'Entities' in rows[0]:
+            fields.append('Entities')
+    matches = []
+    for row in rows:
+        if any(query.lower() in row.get(field, '').lower() for field in fields):
+            matches.append(row)
+        if len(matches) >= limit:
+            break
+    return matches
+
+
+def _ref_search_by_pattern(rows, pattern, field='SourcePath', limit=100):
+    # Only for globs without regex metacharacters other than '.' (those
+    # match literally now; see test_glob_metacharacters_match_literally)
+    if '*' in pattern or '?' in pattern:
+        regex = pattern.replace('.', r'\.').replace('*', '.*').replace('?', '.')
+        regex = f'^{regex}$'
+    else:
+        regex = pattern
+    try:
+        compiled = re.compile(regex, re.IGNORECASE)
+    except re.error:
+        return _ref_search_mapping(rows, pattern, limit, [field])
+    matches = []
+    for row in rows:
+        if compiled.search(row.get(field, '')):
+            matches.append(row)
+            if len(matches) >= limit:
+                break
+    return matches
+
+
+def _ref_search_residuals(rows, query=None, limit=100):
+    residuals = [row for row in rows if row.get('IsResidual', '').lower() == 'true']
+    if not query:
+        return residuals[:limit]
+    return _ref_search_mapping(residuals, query, limit)
+
+
+def _ref_confidence(row):
+    try:
+        return float(row.get('Confidence', '0'))
+    except (ValueError, TypeError):
+        return None
+
+
+def _ref_search_by_confidence(rows, min_confidence=None, max_confidence=None, limit=100):
+    matches = []
+    for row in rows:
+        conf = _ref_confidence(row)
+        if conf is None:
+            continue
+        if min_confidence is not None and conf < min_confidence:
+            continue
+        if max_confidence is not None and conf > max_confidence:
+            continue
+        matches.append(row)
+        if len(matches) >= limit:
+            break
+    return matches
+
+
+def _ref_stats(rows):
+    by_label, by_action = {}, {}
+    residual_count = 0
+    confidences = []
+    for row in rows:
+        label = row.get('Label', 'uncategorized')
+        by_label[label] = by_label.get(label, 0) + 1
+        action = row.get('Action', 'Skip')
+        by_action[action] = by_action.get(action, 0) + 1
+        if row.get('IsResidual', '').lower() == 'true':
+            residual_count += 1
+        conf = _ref_confidence(row)
+        if conf is not None:
+            confidences.append(conf)
+    total = len(rows)
+    return {
+        'total_files': total,
+        'by_label': by_label,
+        'by_action': by_action,
+        'residual_count': residual_count,
+        'residual_percentage': (residual_count / total * 100) if total > 0 else 0,
+        'avg_confidence': sum(confidences) / len(confidences) if confidences else 0.0,
+        'unique_labels': len(by_label),
+    }
+
+
+def _row(path, label='docs', action='Move', residual='False', confidence='0.9', **extra):
+    row = {
+        'SourcePath': path, 'Label': label, 'Action': action,
+        'IsResidual': residual, 'Confidence': confidence, 'Why': '',
+    }
+    row.update(extra)
+    return row
+
+
+@pytest.fixture
+def rows():
+    rows = [
+        _row('/in/Docs/report_2023.pdf', confidence='0.95'),
+        _row('/in/Docs/REPORT.PDF', label='Reports', confidence=' 0.7 '),
+        _row('/in/misc/notes.txt', label='', action='Skip', residual='True', confidence=''),
+        _row('/in/misc/a.pdf.bak', residual='true', confidence='nan'),
+        _row('/in/Photos/2019/beach.jpg', label='photos', residual='TRUE', confidence='abc'),
+        _row('/in/Photos/pdf-guide.md', residual='yes', confidence='1e-1'),
+        _row('/in/Café/menu.pdf', confidence='inf', Why='matched café'),
+        _row('/in/x?y/odd.pdf', confidence=None),
+        _row('/in/Clients/Acme/invoice.pdf', residual='True', confidence='0.3'),
+        _row('/in/Clients/Acme/q.pdf', confidence='-0.5'),
+    ]
+    # Rows missing fields entirely
+    rows.append({'SourcePath': '/in/bare/file.pdf'})
+    rows.append({'SourcePath': '/in/bare/residual.txt', 'IsResidual': 'True'})
+    return rows
+
+
+def _ids(rows):
+    return [id(row) for row in rows]
+
+
+@pytest.fixture(params=["rows", "table"])
+def source(request, rows):
+    """Each search runs against the plain rows and a prebuilt MappingTable."""
+    return rows if request.param == "rows" else MappingTable(rows)
+
+
+@pytest.mark.parametrize("query, kwargs", [
+    ("pdf", {}),
+    ("PDF", {"limit": 2}),
+    ("docs", {"fields": ["Label"]}),
+    ("café", {}),
+    ("skip", {}),
+    ("nothing-matches", {}),
+    ("  ", {}),
+    ("pdf", {"limit": 0}),
+    ("docs", {"limit": 0}),
+    ("pdf", {"limit": -1}),
+])
+def test_search_mapping_matches_row_based(source, rows, query, kwargs):
+    expected = _ref_search_mapping(rows, query, **kwargs)
+
+    assert _ids(search.search_mapping(source, query, **kwargs)) == _ids(expected)
+
+
+@pytest.mark.parametrize("pattern, kwargs", [
+    # Globs are anchored and case-insensitive; '.' is literal
+    ("*.pdf", {}),
+    ("*/Docs/*", {}),
+    ("/in/misc/?.pdf*", {}),
+    ("*pdf*", {"limit": 3}),
+    ("*.PDF", {"field": "SourcePath"}),
+    ("d*", {"field": "Label"}),
+    ("report*", {}),
+    # Anything else is an unanchored regex
+    (r"\d{4}", {}),
+    (r"^/in/photos/", {}),
+    (r"report|invoice", {}),
+    ("report", {}),
+    ("pdf", {"limit": 0}),
+    ("*misc*", {"limit": -2}),
+    # Invalid regexes fall back to a substring search
+    ("x?y/", {}),
+    ("(unclosed", {}),
+    ("(unclosed", {"limit": 0}),
+    ("[", {"field": "Label"}),
+])
+def test_search_by_pattern_matches_row_based(source, rows, pattern, kwargs):
+    expected = _ref_search_by_pattern(rows, pattern, **kwargs)
+
+    assert _ids(search.search_by_pattern(source, pattern, **kwargs)) == _ids(expected)
+
+
+@pytest.mark.parametrize("query, kwargs", [
+    (None, {}),
+    (None, {"limit": 1}),
+    ("", {}),
+    ("pdf", {}),
+    ("acme", {"limit": 0}),
+    ("notes", {"limit": 0}),
+    (None, {"limit": 0}),
+    (None, {"limit": -1}),
+    ("notes", {}),
+])
+def test_search_residuals_matches_row_based(source, rows, query, kwargs):
+    expected = _ref_search_residuals(rows, query, **kwargs)
+
+    assert _ids(search.search_residuals(source, query, **kwargs)) == _ids(expected)
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    ("*(1)*", ['/in/docs (1)/b.pdf']),
+    ("*a+b*", ['/in/a+b/d.pdf']),
+    ("*[x]*", ['/in/[x]/c.pdf']),
+    ("*.pdf", ['/in/docs (1)/b.pdf', '/in/a+b/d.pdf', '/in/[x]/c.pdf']),
+])
+def test_glob_metacharacters_match_literally(pattern, expected):
+    paths = ['/in/docs (1)/b.pdf', '/in/a+b/d.pdf', '/in/[x]/c.pdf', '/in/x/e.txt']
+    rows = [{'SourcePath': path} for path in paths]
+
+    assert [row['SourcePath'] for row in search.search_by_pattern(rows, pattern)] == expected
+
+
+def test_search_residuals_default_fields_follow_first_residual():
+    rows = [
+        _row('/in/a.pdf'),
+        _row('/in/b.pdf', residual='True', Entities='Acme'),
+        _row('/in/c.pdf', residual='True', Entities='Acme, Globex'),
+    ]
+
+    # Entities is searched because the first residual row has it
+    assert search.search_residuals(rows, 'globex') == [rows[2]]
+    assert _ids(search.search_residuals(rows, 'acme')) == _ids(
+        _ref_search_residuals(rows, 'acme')
+    )
+
+
+def test_search_residuals_only_accepts_true(rows):
+    found = search.search_residuals(rows)
+
+    # "yes" and blank are not residual; any case of "true" is
+    assert {row['SourcePath'] for row in found} == {
+        '/in/misc/notes.txt', '/in/misc/a.pdf.bak', '/in/Photos/2019/beach.jpg',
+        '/in/Clients/Acme/invoice.pdf', '/in/bare/residual.txt',
+    }
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"min_confidence": 0.5},
+    {"max_confidence": 0.5},
+    {"min_confidence": 0.2, "max_confidence": 0.8},
+    {"min_confidence": 2.0},
+    {"limit": 0},
+    {"limit": -1},
+    {"limit": 3},
+])
+def test_search_by_confidence_matches_row_based(source, rows, kwargs):
+    expected = _ref_search_by_confidence(rows, **kwargs)
+
+    assert _ids(search.search_by_confidence(source, **kwargs)) == _ids(expected)
+
+
+def test_search_by_confidence_skips_invalid_and_keeps_nan(rows):
+    found = {row['SourcePath'] for row in search.search_by_confidence(rows)}
+
+    # Blank, non-numeric and None confidences are skipped; a missing one
+    # counts as 0; "nan" parses and never fails a bound
+    assert '/in/misc/notes.txt' not in found
+    assert '/in/Photos/2019/beach.jpg' not in found
+    assert '/in/x?y/odd.pdf' not in found
+    assert '/in/bare/file.pdf' in found
+    assert '/in/misc/a.pdf.bak' in found
+    assert '/in/misc/a.pdf.bak' in {
+        row['SourcePath']
+        for row in search.search_by_confidence(rows, min_confidence=0.5, max_confidence=0.6)
+    }
+
+
+def test_get_search_stats_matches_row_based(source, rows):
+    stats = search.get_search_stats(source)
+    expected = _ref_stats(rows)
+
+    # A parsed "nan" makes the average NaN, as it always did
+    assert math.isnan(stats.pop('avg_confidence'))
+    assert math.isnan(expected.pop('avg_confidence'))
+    assert stats == expected
+
+
+def test_get_search_stats_average_over_valid_confidences():
+    rows = [
+        _row('/a', confidence='0.5'),
+        _row('/b', confidence=''),
+        _row('/c', confidence='1'),
+        {'SourcePath': '/d'},
+    ]
+
+    stats = search.get_search_stats(rows)
+
+    assert stats == _ref_stats(rows)
+    assert stats['avg_confidence'] == pytest.approx(0.5)
+
+
+def test_get_search_stats_empty():
+    assert search.get_search_stats([]) == _ref_stats([])
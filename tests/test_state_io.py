@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from siftwise.state import io
+from siftwise.state.io import load_mapping, write_mapping
+
+pytestmark = pytest.mark.skipif(io.pq is None, reason="pyarrow not installed")
+
+
+def _edit_csv(path, old, new):
+    text = path.read_text(encoding="utf-8")
+    path.write_text(text.replace(old, new), encoding="utf-8")
+
+
+def test_load_mapping_uses_parquet_mirror_while_csv_is_unchanged(tmp_path, monkeypatch):
+    write_mapping(tmp_path, [{"SourcePath": "/in/a.pdf", "Action": "Move"}])
+
+    # Served from the mirror: the CSV is never opened
+    monkeypatch.setattr(io.csv, "DictReader", None)
+    rows = load_mapping(tmp_path)
+
+    assert rows[0]["SourcePath"] == "/in/a.pdf"
+    assert rows[0]["Action"] == "Move"
+
+
+def test_load_mapping_reads_csv_edited_after_mirror(tmp_path):
+    csv_path = write_mapping(tmp_path, [{"SourcePath": "/in/a.pdf", "Action": "Move"}])
+    parquet_mtime = (tmp_path / "Mapping.parquet").stat().st_mtime_ns
+
+    _edit_csv(csv_path, "Move", "Skip")
+    # Same or older mtime than the mirror, as with cp -p, a backup restore
+    # or an edit within the filesystem's timestamp granularity
+    os.utime(csv_path, ns=(parquet_mtime - 10**9, parquet_mtime - 10**9))
+
+    assert load_mapping(tmp_path)[0]["Action"] == "Skip"
+
+
+def test_load_mapping_reads_csv_edited_within_mtime_granularity(tmp_path):
+    csv_path = write_mapping(tmp_path, [{"SourcePath": "/in/a.pdf", "Action": "Move"}])
+    st = csv_path.stat()
+
+    _edit_csv(csv_path, "Move", "Copy")
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert load_mapping(tmp_path)[0]["Action"] == "Copy"
@@ -0,0 +1,79 @@
+import json
+
+from siftwise.undo.undo import undo_last_run
+
+
+def _write_journal(sift_dir, events):
+    sift_dir.mkdir(parents=True, exist_ok=True)
+    with (sift_dir / "journal.jsonl").open("w", encoding="utf-8") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def test_undo_restores_onto_path_vacated_by_earlier_reversal(tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir()
+    dst.mkdir()
+
+    # Run: src/A -> dst/X, then src/B -> src/A
+    (dst / "X").write_text("first")
+    (src / "A").write_text("second")
+    _write_journal(tmp_path / ".sift", [
+        {"run_id": 1, "event": "Move", "src": str(src / "A"), "final_dst": str(dst / "X")},
+        {"run_id": 1, "event": "Move", "src": str(src / "B"), "final_dst": str(src / "A")},
+    ])
+
+    summary = undo_last_run(dst, tmp_path / ".sift")
+
+    assert summary["undone"] == 2
+    assert (src / "A").read_text() == "first"
+    assert (src / "B").read_text() == "second"
+    assert not (src / "A__dup1").exists()
+    assert not (dst / "X").exists()
+
+
+def test_undo_what_if_plans_the_same_chain(tmp_path, capsys):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir()
+    dst.mkdir()
+
+    (dst / "X").write_text("first")
+    (src / "A").write_text("second")
+    _write_journal(tmp_path / ".sift", [
+        {"run_id": 1, "event": "Move", "src": str(src / "A"), "final_dst": str(dst / "X")},
+        {"run_id": 1, "event": "Move", "src": str(src / "B"), "final_dst": str(src / "A")},
+    ])
+
+    undo_last_run(dst, tmp_path / ".sift", what_if=True)
+
+    out = capsys.readouterr().out
+    assert f"DRY: UNDO Move {dst / 'X'} -> {src / 'A'}" in out
+    assert "__dup" not in out
+    assert (dst / "X").exists()
+
+
+def test_undo_does_not_overwrite_path_a_failed_reversal_kept(tmp_path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    src.mkdir()
+    dst.mkdir()
+
+    # Run: src/A -> dst/X, then blocker/B -> src/A. "blocker" is now a
+    # file, so restoring blocker/B fails and src/A is never freed.
+    (dst / "X").write_text("first")
+    (src / "A").write_text("second")
+    (tmp_path / "blocker").write_text("not a folder")
+    _write_journal(tmp_path / ".sift", [
+        {"run_id": 1, "event": "Move", "src": str(src / "A"), "final_dst": str(dst / "X")},
+        {"run_id": 1, "event": "Move", "src": str(tmp_path / "blocker" / "B"), "final_dst": str(src / "A")},
+    ])
+
+    summary = undo_last_run(dst, tmp_path / ".sift")
+
+    assert summary["undone"] == 1
+    assert summary["skipped"] == 1
+    assert (src / "A").read_text() == "second"
+    assert (src / "A__dup1").read_text() == "first"
+    assert not (dst / "X").exists()